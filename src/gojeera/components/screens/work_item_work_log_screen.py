@@ -11,7 +11,7 @@ from textual.widgets import Button, Static
 from gojeera.components.screens.confirmation_screen import ConfirmationScreen
 from gojeera.components.screens.work_log_screen import LogWorkScreen
 from gojeera.internal.jira.controller import APIControllerResponse
-from gojeera.utils.jira.urls import build_external_url_for_work_item
+from gojeera.utils.jira.urls import build_external_url_for_work_item, get_base_url
 from gojeera.utils.ui.focus import focus_first_available
 from gojeera.widgets.layout.extended_footer import ExtendedFooter
 from gojeera.widgets.layout.extended_modal_screen import ExtendedModalScreen
@@ -202,6 +202,12 @@ class WorkItemWorkLogScreen(ExtendedModalScreen[dict]):
                     list_view.clear_records()
                     return
 
+                server_base_url = getattr(
+                    getattr(getattr(application, 'atlassian_context', None), 'server_info', None),
+                    'base_url',
+                    None,
+                )
+                work_item_base_url = get_base_url(application)
                 records: list[Record] = []
                 for worklog in result.logs:
                     author_name = worklog.author.display_name if worklog.author else 'Unknown'
@@ -218,21 +224,15 @@ class WorkItemWorkLogScreen(ExtendedModalScreen[dict]):
                     metadata = ' '.join(metadata_parts)
                     content = ''
                     if worklog.comment:
-                        base_url = getattr(
-                            getattr(
-                                getattr(self.app, 'atlassian_context', None), 'server_info', None
-                            ),
-                            'base_url',
-                            None,
-                        )
-                        if content := worklog.get_comment(base_url=base_url):
+                        if content := worklog.get_comment(base_url=server_base_url):
                             content = content.strip()
                     title = content or 'No description'
 
                     url = build_external_url_for_work_item(
                         self._work_item_key,
-                        cast('JiraApp', self.app),
+                        application,
                         focused_work_log_id=worklog.id,
+                        base_url=work_item_base_url,
                     )
 
                     started_formatted = None
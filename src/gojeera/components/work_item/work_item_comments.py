@@ -30,7 +30,7 @@ from gojeera.internal.models.work_items import (
     _build_attachment_markdown_details,
 )
 from gojeera.utils.jira.urls import build_external_url_for_work_item
-from gojeera.utils.markdown.adf_helpers import convert_adf_to_markdown
+from gojeera.utils.markdown.adf_helpers import convert_many_adfs_to_markdown
 from gojeera.widgets.markdown.gojeera_markdown import GojeeraMarkdown
 
 if TYPE_CHECKING:
@@ -741,17 +741,30 @@ class WorkItemCommentsWidget(Vertical, can_focus=False):
             attachments
         )
         sorted_items = sorted(items, key=lambda comment: comment.updated or 0, reverse=True)
+        base_url = getattr(
+            getattr(getattr(self.app, 'atlassian_context', None), 'server_info', None),
+            'base_url',
+            None,
+        )
+        adf_comments = [
+            comment
+            for comment in sorted_items
+            if comment.body is not None and not isinstance(comment.body, str)
+        ]
+        adf_contents = iter(
+            convert_many_adfs_to_markdown(
+                [cast(dict, comment.body) for comment in adf_comments],
+                base_url,
+                rendered_bodies=[comment.rendered_body for comment in adf_comments],
+                media_attachment_details=media_attachment_details,
+                ordered_attachment_details=ordered_attachment_details,
+            )
+        )
 
         with self.app.batch_update():
             await self._clear_rendered_comments()
 
             for index, comment in enumerate(sorted_items):
-                base_url = getattr(
-                    getattr(getattr(self.app, 'atlassian_context', None), 'server_info', None),
-                    'base_url',
-                    None,
-                )
-
                 inner_container = Vertical(classes='comment-item-inner')
 
                 header_row = Horizontal(classes='comment-header-row')
@@ -778,13 +791,7 @@ class WorkItemCommentsWidget(Vertical, can_focus=False):
                 if isinstance(comment.body, str):
                     content = comment.body
                 elif comment.body is not None:
-                    content = convert_adf_to_markdown(
-                        comment.body,
-                        base_url,
-                        rendered_body=comment.rendered_body,
-                        media_attachment_details=media_attachment_details,
-                        ordered_attachment_details=ordered_attachment_details,
-                    )
+                    content = next(adf_contents)
                 else:
                     content = ''
 
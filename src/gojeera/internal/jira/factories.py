@@ -30,6 +30,8 @@ from gojeera.utils.data.mappings import get_nested
 
 logger = logging.getLogger('gojeera')
 
+GENERIC_WORK_ITEM_FIELD_IDS = frozenset(item.value for item in JiraWorkItemGenericFields)
+
 
 def _optional_string(value: Any) -> str | None:
     return str(value) if value is not None else None
@@ -137,7 +139,7 @@ class WorkItemFactory:
 
         additional_fields: dict[str, Any] = get_additional_fields_values(
             fields,
-            [item.value for item in JiraWorkItemGenericFields],
+            GENERIC_WORK_ITEM_FIELD_IDS,
         )
 
         sprint: JiraSprint | None = None
@@ -26,18 +26,23 @@ def _convert_adf_to_markdown(value: dict, base_url: str | None = None) -> str:
 def _build_attachment_markdown_details(
     attachments: list[Attachment] | None,
 ) -> tuple[dict[str, tuple[str, str | None]], list[tuple[str, str | None]]]:
-    from gojeera.utils.jira.urls import build_external_url_for_attachment
+    from gojeera.utils.jira.urls import build_external_url_for_attachment, get_base_url
 
     media_attachment_details: dict[str, tuple[str, str | None]] = {}
     ordered_attachment_details: list[tuple[str, str | None]] = []
+    base_url: str | None = None
 
     for attachment in attachments or []:
         if not attachment.id or not attachment.filename:
             continue
 
+        if base_url is None:
+            base_url = get_base_url()
         resolved = (
             attachment.filename,
-            build_external_url_for_attachment(attachment.id, attachment.filename),
+            build_external_url_for_attachment(
+                attachment.id, attachment.filename, base_url=base_url
+            ),
         )
         media_attachment_details[attachment.id] = resolved
         media_attachment_details[attachment.filename] = resolved
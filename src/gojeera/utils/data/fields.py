@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from enum import Enum
 from typing import Any
 
@@ -308,29 +308,43 @@ class PendingChangesWidget(Grid, can_focus=False):
         self.loading = is_loading
 
 
+_CUSTOM_FIELD_ID_PREFIX = 'customfield_'
+_CUSTOM_FIELD_ID_PREFIX_LENGTH = len(_CUSTOM_FIELD_ID_PREFIX)
+
+
+def _is_custom_field_id(field_id: str) -> bool:
+    # Lower-case only the prefix instead of the whole field id.
+    return field_id[:_CUSTOM_FIELD_ID_PREFIX_LENGTH].lower() == _CUSTOM_FIELD_ID_PREFIX
+
+
 def get_custom_fields_values(fields_values: dict, edit_metadata_fields: dict) -> dict[str, Any]:
-    values: dict[str, Any] = {}
-    for field_id, field_data in edit_metadata_fields.items():
-        schema = field_data.get('schema', {})
-        if schema.get('customId') or schema.get('custom'):
-            values[field_id] = fields_values.get(field_id)
+    values: dict[str, Any] = {
+        field_id: fields_values.get(field_id)
+        for field_id, field_data in edit_metadata_fields.items()
+        if (schema := field_data.get('schema', {})).get('customId') or schema.get('custom')
+    }
 
     for field_id, field_value in fields_values.items():
-        if not field_id.lower().startswith('customfield_'):
+        if field_id in values:
             continue
-        if field_id not in values:
+        if _is_custom_field_id(field_id):
             values[field_id] = field_value
     return values
 
 
 def get_additional_fields_values(
-    fields_values: dict[str, Any], ignored_fields: list[str]
+    fields_values: dict[str, Any], ignored_fields: Collection[str]
 ) -> dict[str, Any]:
+    ignored = (
+        ignored_fields
+        if isinstance(ignored_fields, (set, frozenset))
+        else frozenset(ignored_fields)
+    )
     additional_fields: dict[str, Any] = {}
     for field_id, field_value in fields_values.items():
-        if field_id in ignored_fields:
+        if field_id in ignored:
             continue
-        if field_id.lower().startswith('customfield_'):
+        if _is_custom_field_id(field_id):
             continue
         additional_fields[field_id] = field_value
     return additional_fields
@@ -20,7 +20,7 @@ def normalize_work_item_key(value: str) -> str | None:
     return candidate.upper()
 
 
-def _get_base_url(app: 'JiraApp | None' = None) -> str:
+def get_base_url(app: 'JiraApp | None' = None) -> str:
     """Get base URL from app Atlassian context or fallback to api_base_url.
 
     Args:
@@ -133,8 +133,12 @@ def build_external_url_for_work_item(
     *,
     focused_comment_id: str | None = None,
     focused_work_log_id: str | None = None,
+    base_url: str | None = None,
 ) -> str | None:
-    """Build a Jira browse URL for a work item, optionally focused on a comment or work log."""
+    """Build a Jira browse URL for a work item, optionally focused on a comment or work log.
+
+    Pass a pre-resolved `base_url` when building many URLs to skip resolving it per call.
+    """
     if not key:
         return None
 
@@ -144,7 +148,8 @@ def build_external_url_for_work_item(
     if focused_work_log_id:
         query['focusedWorklogId'] = focused_work_log_id
 
-    base_url = _get_base_url(app)
+    if base_url is None:
+        base_url = get_base_url(app)
     url = f'{base_url}/browse/{key}'
     if query:
         return f'{url}?{urlencode(query)}'
@@ -152,7 +157,11 @@ def build_external_url_for_work_item(
 
 
 def build_external_url_for_attachment(
-    attachment_id: str, filename: str, app: 'JiraApp | None' = None
+    attachment_id: str,
+    filename: str,
+    app: 'JiraApp | None' = None,
+    *,
+    base_url: str | None = None,
 ) -> str | None:
     """Build URL for a Jira attachment.
 
@@ -160,11 +169,13 @@ def build_external_url_for_attachment(
         attachment_id: Attachment ID
         filename: Attachment filename
         app: Optional JiraApp instance
+        base_url: Optional pre-resolved Jira base URL; resolved from `app` when omitted
 
     Returns:
         Full URL to the attachment, or None if inputs are empty
     """
     if not attachment_id or not filename:
         return None
-    base_url = _get_base_url(app)
+    if base_url is None:
+        base_url = get_base_url(app)
     return f'{base_url}/secure/attachment/{attachment_id}/{quote(filename)}'
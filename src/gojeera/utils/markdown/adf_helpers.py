@@ -1,5 +1,10 @@
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import re
+import sys
 from typing import Literal, cast, overload
 from urllib.parse import quote, urljoin, urlparse
 
@@ -17,6 +22,29 @@ GOJEERA_STATUS_MARKER_SUFFIX = '__GOJEERA_STATUS_END__'
 GOJEERA_DECISION_MARKER_PREFIX = '__GOJEERA_DECISION_START_'
 GOJEERA_DECISION_MARKER_SUFFIX = '__GOJEERA_DECISION_END__'
 
+# markdown-it keeps per-document state in the parse call, so one configured
+# parser can be shared by every text_to_adf invocation.
+_MARKDOWN_TO_ADF_PARSER = MarkdownIt('gfm-like').use(tasklists_plugin)
+
+# Single-line text made only of letters, digits, spaces and punctuation that neither
+# markdown-it nor linkify treat specially parses to a single text paragraph. Periods
+# are only allowed before a space or the end so domains like `example.com` still
+# reach the linkify rule, and the first character must be a letter so ordered list
+# markers like `1.` are never matched.
+_PLAIN_TEXT_PATTERN = re.compile(r'[^\W\d_](?:[^\W_]|[ ,;?\'"()]|\.(?= |$))*(?<! )')
+
+_INCOMPLETE_IMAGE_PATTERN = re.compile(r'!\[[^\]]*$')
+_BRACKETED_TEXT_WITHOUT_URL_PATTERN = re.compile(r'\[[^\]]+\](?!\()')
+# Task, alert, and decision markers look like bracketed text but are not broken links.
+_NON_LINK_BRACKET_MARKER_PATTERN = re.compile(
+    r'^\s*-?\s*\[[ xX]\](?:\s|$)'
+    r'|\[!(?:NOTE|TIP|IMPORTANT|WARNING|CAUTION)\]'
+    r'|\[decision:[dau]\]'
+)
+_MALFORMED_RULE_PATTERN = re.compile(r'^(-{3,}|_{3,}|\*{3,})[^\s\-_*]')
+_INLINE_TASK_BULLET_PATTERN = re.compile(r'([^\n\s-])(-\s+\[[ xX]\])')
+_INLINE_PLAIN_BULLET_PATTERN = re.compile(r'([^\n\s-])(-\s+(?!\[))')
+
 
 def _text_node_with_marks(source_node: dict, text: str) -> dict[str, object]:
     text_node: dict[str, object] = {'type': 'text', 'text': text}
@@ -415,6 +443,11 @@ def fix_codeblock_in_list(adf: dict) -> dict:
     return adf
 
 
+def _is_root_ordered_item(line: str) -> bool:
+    number, dot, rest = line.partition('.')
+    return bool(dot) and number.isdecimal() and rest[:1].isspace()
+
+
 def render_task_checkboxes(text: str) -> str:
     """Replace GFM task list markers with UTF-8 checkbox characters.
     Args:
@@ -424,57 +457,53 @@ def render_task_checkboxes(text: str) -> str:
         Text with task list markers replaced by UTF-8 checkboxes in separate paragraphs
     """
 
-    text = re.sub(r'([^\n\s-])(-\s+\[[ xX]\])', r'\1\n    \2', text)
+    # Every rewrite below starts at a `-` bullet marker.
+    if '-' not in text:
+        return text
+
+    if '[' in text:
+        text = _INLINE_TASK_BULLET_PATTERN.sub(r'\1\n    \2', text)
 
-    text = re.sub(r'([^\n\s-])(-\s+(?!\[))', r'\1\n    \2', text)
+    text = _INLINE_PLAIN_BULLET_PATTERN.sub(r'\1\n    \2', text)
 
     lines = text.split('\n')
-    fixed_lines = []
+    last_index = len(lines) - 1
+    result_lines: list[str] = []
     in_nested_context = False
     previous_line = ''
 
-    for line in lines:
-        is_unindented_bullet = re.match(r'^-\s+', line)
+    for i, line in enumerate(lines):
+        source_line = line
+        is_unindented_bullet = line[:1] == '-' and line[1:2].isspace()
 
-        is_root_ordered = re.match(r'^\d+\.\s+', line)
+        is_root_ordered = _is_root_ordered_item(line)
 
         is_already_indented = line.startswith(' ')
 
         if is_unindented_bullet:
             if in_nested_context:
-                fixed_lines.append('    ' + line)
-                previous_line = line
-                continue
-            elif re.match(r'^\d+\.\s+', previous_line):
+                line = '    ' + line
+            elif _is_root_ordered_item(previous_line):
                 in_nested_context = True
-                fixed_lines.append('    ' + line)
-                previous_line = line
-                continue
-        elif is_root_ordered:
+                line = '    ' + line
+        elif is_root_ordered or (not is_already_indented and line.strip() != ''):
             in_nested_context = False
-        elif not is_already_indented and line.strip() == '':
-            pass
-        elif not is_already_indented and line.strip() != '' and not is_unindented_bullet:
-            in_nested_context = False
-
-        fixed_lines.append(line)
-        previous_line = line
-    text = '\n'.join(fixed_lines)
-
-    lines = text.split('\n')
-    result_lines = []
 
-    for i, line in enumerate(lines):
-        match = re.match(r'^(\s*)-\s+\[([ xX])\](.*)$', line)
-        if match:
-            indent, checkbox_state, rest = match.groups()
+        previous_line = source_line
 
-            if checkbox_state == ' ':
-                result_lines.append(f'{indent}☐{rest}')
-            else:
-                result_lines.append(f'{indent}☑{rest}')
+        stripped = line.lstrip()
+        marker_body = stripped[1:].lstrip() if stripped.startswith('-') else ''
+        if (
+            marker_body[:1] == '['
+            and marker_body[2:3] == ']'
+            and marker_body[1:2] in (' ', 'x', 'X')
+            and len(marker_body) < len(stripped) - 1
+        ):
+            indent = line[: len(line) - len(stripped)]
+            checkbox = '☐' if marker_body[1] == ' ' else '☑'
+            result_lines.append(indent + checkbox + marker_body[3:])
 
-            if i < len(lines) - 1:
+            if i < last_index:
                 result_lines.append('')
         else:
             result_lines.append(line)
@@ -955,6 +984,70 @@ def convert_adf_to_markdown(
     return markdown
 
 
+def convert_many_adfs_to_markdown(
+    values: list[dict],
+    base_url: str | None = None,
+    rendered_bodies: list[str | None] | None = None,
+    media_attachment_details: dict[str, tuple[str, str | None]] | None = None,
+    ordered_attachment_details: list[tuple[str, str | None]] | None = None,
+    workers: int | None = None,
+) -> list[str]:
+    """Convert several independent ADF documents to Markdown.
+
+    Documents are converted serially unless the interpreter runs without the GIL (e.g.
+    CPython 3.13t), in which case they are spread over a thread pool; each worker runs in a
+    copy of the caller's context so `CONFIGURATION` stays available. With the GIL enabled
+    the conversion is CPU-bound pure Python and threads only add overhead.
+
+    Args:
+        values: ADF documents to convert
+        base_url: Optional base URL of Jira instance, forwarded to `convert_adf_to_markdown`
+        rendered_bodies: Optional rendered HTML bodies, one per entry in `values`
+        media_attachment_details: Attachment details shared by all documents
+        ordered_attachment_details: Ordered attachment details shared by all documents
+        workers: Maximum number of worker threads; `None` lets the executor decide
+
+    Returns:
+        Markdown strings in the same order as `values`
+    """
+    if rendered_bodies is None:
+        rendered_bodies = [None] * len(values)
+
+    def convert(value: dict, rendered_body: str | None) -> str:
+        return convert_adf_to_markdown(
+            value,
+            base_url,
+            rendered_body=rendered_body,
+            media_attachment_details=media_attachment_details,
+            ordered_attachment_details=ordered_attachment_details,
+        )
+
+    if len(values) <= 1 or workers == 1 or getattr(sys, '_is_gil_enabled', lambda: True)():
+        return [convert(value, body) for value, body in zip(values, rendered_bodies, strict=True)]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(copy_context().run, convert, value, body)
+            for value, body in zip(values, rendered_bodies, strict=True)
+        ]
+        return [future.result() for future in futures]
+
+
+def _build_paragraph_node(content: list[dict]) -> dict:
+    return {'type': 'paragraph', 'content': content}
+
+
+def _build_table_cell_node(cell_type: str, cell_content: list[dict]) -> dict:
+    return {
+        'type': cell_type,
+        'content': [_build_paragraph_node(cell_content)] if cell_content else [],
+    }
+
+
+def _build_table_row_node(cells: list[dict]) -> dict:
+    return {'type': 'tableRow', 'content': cells}
+
+
 def _is_task_list(tokens: list, start_index: int) -> bool:
     """Check if a bullet list is a task list using tasklists plugin attributes.
 
@@ -978,16 +1071,16 @@ def _is_task_list(tokens: list, start_index: int) -> bool:
 
 def _convert_task_list_tokens(
     tokens: list, start_index: int, track_warnings: bool = False
-) -> tuple[list[dict], int] | tuple[list[dict], int, list[str]]:
+) -> tuple[list[dict], int, list[str]]:
     """Convert markdown task list tokens to ADF taskItem nodes.
 
     Args:
         tokens: List of markdown-it Token objects
         start_index: Starting index in tokens list
-        track_warnings: If True, returns tuple of (task_items, end_index, warnings)
+        track_warnings: If True, reports unsupported inline elements as warnings
 
     Returns:
-        Tuple of (task_items, end_index), or (task_items, end_index, warnings) if track_warnings=True
+        Tuple of (task_items, end_index, warnings)
     """
     task_items = []
     warnings: list[str] = []
@@ -1020,32 +1113,27 @@ def _convert_task_list_tokens(
 
                 if inner_token.type == 'paragraph_open':
                     i += 1
-                    inline_token = tokens[i]
+                    children = tokens[i].children
 
-                    if inline_token.children and len(inline_token.children) > 0:
-                        first_child = inline_token.children[0]
+                    if children:
+                        first_child = children[0]
                         if first_child.type == 'html_inline':
                             if 'checked="checked"' in first_child.content:
                                 task_state = 'DONE'
                             else:
                                 task_state = 'TODO'
 
-                            text_children = inline_token.children[1:]
+                            text_children = children[1:]
                         else:
-                            text_children = inline_token.children
+                            text_children = children
                     else:
                         text_children = []
 
                     if text_children:
-                        if track_warnings:
-                            inline_result = cast(
-                                tuple[list[dict], list[str]],
-                                _convert_inline_tokens(text_children, track_warnings=True),
-                            )
-                            para_content, inline_warnings = inline_result
-                            warnings.extend(inline_warnings)
-                        else:
-                            para_content = _convert_inline_tokens(text_children)
+                        para_content, inline_warnings = _convert_inline_tokens(
+                            text_children, track_warnings
+                        )
+                        warnings.extend(inline_warnings)
 
                         if para_content:
                             item_content.extend(para_content)
@@ -1067,24 +1155,21 @@ def _convert_task_list_tokens(
         else:
             i += 1
 
-    if track_warnings:
-        return (task_items, i + 1, warnings)
-    else:
-        return (task_items, i + 1)
+    return (task_items, i + 1, warnings)
 
 
 def _convert_blockquote_tokens(
     tokens: list, start_index: int, track_warnings: bool = False
-) -> tuple[dict, int] | tuple[dict, int, list[str]]:
+) -> tuple[dict, int, list[str]]:
     """Convert markdown blockquote tokens to ADF blockquote or panel nodes.
 
     Args:
         tokens: List of markdown-it Token objects
         start_index: Starting index in tokens list
-        track_warnings: If True, returns tuple of (node, end_index, warnings)
+        track_warnings: If True, reports unsupported elements as warnings
 
     Returns:
-        Tuple of (blockquote_node, end_index), or (node, end_index, warnings) if track_warnings=True
+        Tuple of (blockquote_node, end_index, warnings)
     """
     warnings: list[str] = []
     i = start_index + 1
@@ -1129,13 +1214,13 @@ def _convert_blockquote_tokens(
 
         if is_alert and i == alert_content_starts_at and token.type == 'paragraph_open':
             i += 1
-            inline_token = tokens[i]
+            children = tokens[i].children
 
-            if inline_token.children:
+            if children:
                 filtered_children = []
                 skip_next_softbreak = False
 
-                for child in inline_token.children:
+                for child in children:
                     if child.type == 'text' and child.content.strip().startswith('[!'):
                         skip_next_softbreak = True
                         continue
@@ -1145,18 +1230,13 @@ def _convert_blockquote_tokens(
                     filtered_children.append(child)
 
                 if filtered_children:
-                    if track_warnings:
-                        inline_result = cast(
-                            tuple[list[dict], list[str]],
-                            _convert_inline_tokens(filtered_children, track_warnings=True),
-                        )
-                        para_content, inline_warnings = inline_result
-                        warnings.extend(inline_warnings)
-                    else:
-                        para_content = _convert_inline_tokens(filtered_children)
+                    para_content, inline_warnings = _convert_inline_tokens(
+                        filtered_children, track_warnings
+                    )
+                    warnings.extend(inline_warnings)
 
                     if para_content:
-                        blockquote_content.append({'type': 'paragraph', 'content': para_content})
+                        blockquote_content.append(_build_paragraph_node(para_content))
 
             i += 2
             continue
@@ -1169,19 +1249,11 @@ def _convert_blockquote_tokens(
             'fence',
             'blockquote_open',
         ):
-            if track_warnings:
-                nested_result = cast(
-                    tuple[list[dict], list[str]],
-                    _convert_tokens_to_adf([token] + tokens[i + 1 : i + 100], track_warnings=True),
-                )
-                nested_content, nested_warnings = nested_result
-                warnings.extend(nested_warnings)
-                if nested_content:
-                    blockquote_content.extend(nested_content)
-            else:
-                nested_content = _convert_tokens_to_adf([token] + tokens[i + 1 : i + 100])
-                if nested_content:
-                    blockquote_content.extend(nested_content)
+            nested_content, nested_warnings = _convert_tokens_to_adf(
+                [token] + tokens[i + 1 : i + 100], track_warnings
+            )
+            warnings.extend(nested_warnings)
+            blockquote_content.extend(nested_content)
 
             if token.type == 'paragraph_open':
                 i += 3
@@ -1195,24 +1267,21 @@ def _convert_blockquote_tokens(
     else:
         node = {'type': 'blockquote', 'content': blockquote_content}
 
-    if track_warnings:
-        return (node, i + 1, warnings)
-    else:
-        return (node, i + 1)
+    return (node, i + 1, warnings)
 
 
 def _convert_table_tokens(
     tokens: list, start_index: int, track_warnings: bool = False
-) -> tuple[dict, int] | tuple[dict, int, list[str]]:
+) -> tuple[dict, int, list[str]]:
     """Convert markdown table tokens to ADF table nodes.
 
     Args:
         tokens: List of markdown-it Token objects
         start_index: Starting index in tokens list
-        track_warnings: If True, returns tuple of (table_node, end_index, warnings)
+        track_warnings: If True, reports unsupported inline elements as warnings
 
     Returns:
-        Tuple of (table_node, end_index), or (table_node, end_index, warnings) if track_warnings=True
+        Tuple of (table_node, end_index, warnings)
     """
     warnings: list[str] = []
     i = start_index + 1
@@ -1221,12 +1290,6 @@ def _convert_table_tokens(
     def convert_table_cell(inline_token) -> tuple[list[dict], list[str]]:
         return _convert_inline_token_children(inline_token, track_warnings=track_warnings)
 
-    def build_table_cell_node(cell_type: str, cell_content: list[dict]) -> dict:
-        return {
-            'type': cell_type,
-            'content': [{'type': 'paragraph', 'content': cell_content}] if cell_content else [],
-        }
-
     while i < len(tokens):
         token = tokens[i]
 
@@ -1244,13 +1307,13 @@ def _convert_table_tokens(
                     inline_token = tokens[i]
                     cell_content, cell_warnings = convert_table_cell(inline_token)
                     warnings.extend(cell_warnings)
-                    header_cells.append(build_table_cell_node('tableHeader', cell_content))
+                    header_cells.append(_build_table_cell_node('tableHeader', cell_content))
                     i += 2
                 else:
                     i += 1
 
             if header_cells:
-                table_rows.append({'type': 'tableRow', 'content': header_cells})
+                table_rows.append(_build_table_row_node(header_cells))
             i += 2
 
         elif token.type == 'tbody_open':
@@ -1267,13 +1330,13 @@ def _convert_table_tokens(
                             inline_token = tokens[i]
                             cell_content, cell_warnings = convert_table_cell(inline_token)
                             warnings.extend(cell_warnings)
-                            row_cells.append(build_table_cell_node('tableCell', cell_content))
+                            row_cells.append(_build_table_cell_node('tableCell', cell_content))
                             i += 2
                         else:
                             i += 1
 
                     if row_cells:
-                        table_rows.append({'type': 'tableRow', 'content': row_cells})
+                        table_rows.append(_build_table_row_node(row_cells))
                     i += 1
                 else:
                     i += 1
@@ -1284,10 +1347,7 @@ def _convert_table_tokens(
 
     table_node = {'type': 'table', 'content': table_rows}
 
-    if track_warnings:
-        return (table_node, i + 1, warnings)
-    else:
-        return (table_node, i + 1)
+    return (table_node, i + 1, warnings)
 
 
 def _detect_malformed_markdown(_text: str, tokens: list) -> list[str]:
@@ -1302,15 +1362,24 @@ def _detect_malformed_markdown(_text: str, tokens: list) -> list[str]:
     """
     warnings = []
 
-    for token in tokens:
+    for idx, token in enumerate(tokens):
         if token.type == 'inline' and token.content:
             line_num = token.map[0] + 1 if token.map else None
 
-            if hasattr(token, 'children') and token.children:
-                for child in token.children:
+            children = token.children
+            if children:
+                for child in children:
                     if child.type == 'text' and child.content:
                         text_content = child.content
 
+                        # Every check below needs at least one of these characters.
+                        if (
+                            '*' not in text_content
+                            and '`' not in text_content
+                            and '[' not in text_content
+                        ):
+                            continue
+
                         if '**' in text_content:
                             count = text_content.count('**')
                             if count % 2 != 0:
@@ -1319,46 +1388,32 @@ def _detect_malformed_markdown(_text: str, tokens: list) -> list[str]:
                                         f'Line {line_num}: Unclosed bold marker (**) in "{text_content[:50]}"'
                                     )
 
-                        if text_content.count('`') % 2 != 0:
+                        if '`' in text_content and text_content.count('`') % 2 != 0:
                             if line_num:
                                 warnings.append(
                                     f'Line {line_num}: Unclosed code marker (`) in "{text_content[:50]}"'
                                 )
 
-                        if re.search(r'!\[[^\]]*$', text_content):
+                        if _INCOMPLETE_IMAGE_PATTERN.search(text_content):
                             if line_num:
                                 warnings.append(
                                     f'Line {line_num}: Incomplete image syntax in "{text_content[:50]}"'
                                 )
 
-                        if re.search(r'\[[^\]]+\](?!\()', text_content):
-                            is_task_marker = re.match(
-                                r'^-?\s*\[([ xX])\](\s|$)', text_content.strip()
-                            )
-
-                            is_alert_marker = re.search(
-                                r'\[!(NOTE|TIP|IMPORTANT|WARNING|CAUTION)\]', text_content
-                            )
-
-                            is_decision_marker = re.search(r'\[decision:[dau]\]', text_content)
-
-                            if (
-                                not is_task_marker
-                                and not is_alert_marker
-                                and not is_decision_marker
-                                and line_num
+                        if _BRACKETED_TEXT_WITHOUT_URL_PATTERN.search(text_content):
+                            if line_num and not _NON_LINK_BRACKET_MARKER_PATTERN.search(
+                                text_content
                             ):
                                 warnings.append(
                                     f'Line {line_num}: Incomplete link syntax - missing URL in "{text_content[:50]}"'
                                 )
 
         if token.type == 'paragraph_open':
-            idx = tokens.index(token)
             next_tokens = tokens[idx + 1 : idx + 2]
             if next_tokens and next_tokens[0].type == 'inline':
                 inline_content = next_tokens[0].content.strip()
 
-                if re.match(r'^(-{3,}|_{3,}|\*{3,})[^\s\-_*]', inline_content):
+                if _MALFORMED_RULE_PATTERN.match(inline_content):
                     line_num = token.map[0] + 1 if token.map else None
                     if line_num:
                         warnings.append(
@@ -1390,31 +1445,27 @@ def text_to_adf(text: str, track_warnings: bool = False) -> dict | tuple[dict, l
     Returns:
         ADF document structure, or tuple of (ADF document, list of warning messages) if track_warnings=True
     """
+    if text and _PLAIN_TEXT_PATTERN.fullmatch(text):
+        document = {
+            'type': 'doc',
+            'version': 1,
+            'content': [{'type': 'paragraph', 'content': [{'type': 'text', 'text': text}]}],
+        }
+        return (document, []) if track_warnings else document
+
     if not text or not text.strip():
         result = build_empty_adf_document()
         return (result, []) if track_warnings else result
 
-    md = MarkdownIt('gfm-like')
-    md.use(tasklists_plugin)
-    tokens = md.parse(text)
+    tokens = _MARKDOWN_TO_ADF_PARSER.parse(text)
 
-    malformed_warnings = []
-    if track_warnings:
-        malformed_warnings = _detect_malformed_markdown(text, tokens)
+    content, conversion_warnings = _convert_tokens_to_adf(tokens, track_warnings)
+    document = {'type': 'doc', 'version': 1, 'content': content}
+    if not track_warnings:
+        return document
 
-    if track_warnings:
-        result = _convert_tokens_to_adf(tokens, track_warnings=True)
-
-        if isinstance(result, tuple):
-            content, conversion_warnings = result
-
-            all_warnings = malformed_warnings + conversion_warnings
-            return {'type': 'doc', 'version': 1, 'content': content}, all_warnings
-        else:
-            return {'type': 'doc', 'version': 1, 'content': result}, malformed_warnings
-    else:
-        content = _convert_tokens_to_adf(tokens)
-        return {'type': 'doc', 'version': 1, 'content': content}
+    malformed_warnings = _detect_malformed_markdown(text, tokens)
+    return document, malformed_warnings + conversion_warnings
 
 
 def build_empty_adf_document(with_empty_paragraph: bool = False) -> dict:
@@ -1426,201 +1477,171 @@ def build_empty_adf_document(with_empty_paragraph: bool = False) -> dict:
     }
 
 
+def _convert_heading_block(
+    tokens: list, i: int, content: list[dict], warnings: list[str], track_warnings: bool
+) -> int:
+    level = int(tokens[i].tag[1])
+    i += 1
+    heading_content, inline_warnings = _convert_inline_token_children(
+        tokens[i],
+        track_warnings=track_warnings,
+    )
+    warnings.extend(inline_warnings)
+    content.append({'type': 'heading', 'attrs': {'level': level}, 'content': heading_content})
+    return i + 2
+
+
+def _convert_paragraph_block(
+    tokens: list, i: int, content: list[dict], warnings: list[str], track_warnings: bool
+) -> int:
+    i += 1
+    _append_paragraph_from_inline_token(
+        tokens[i],
+        target_content=content,
+        warnings=warnings,
+        track_warnings=track_warnings,
+    )
+    return i + 2
+
+
+def _convert_blockquote_block(
+    tokens: list, i: int, content: list[dict], warnings: list[str], track_warnings: bool
+) -> int:
+    blockquote_node, i, blockquote_warnings = _convert_blockquote_tokens(tokens, i, track_warnings)
+    warnings.extend(blockquote_warnings)
+    content.append(blockquote_node)
+    return i
+
+
+def _convert_rule_block(
+    tokens: list, i: int, content: list[dict], warnings: list[str], track_warnings: bool
+) -> int:
+    content.append({'type': 'rule'})
+    return i + 1
+
+
+def _convert_bullet_list_block(
+    tokens: list, i: int, content: list[dict], warnings: list[str], track_warnings: bool
+) -> int:
+    if _is_task_list(tokens, i):
+        list_content, i, list_warnings = _convert_task_list_tokens(tokens, i, track_warnings)
+        warnings.extend(list_warnings)
+        content.append({'type': 'taskList', 'attrs': {'localId': ''}, 'content': list_content})
+    else:
+        list_content, i, list_warnings = _convert_list_tokens(
+            tokens, i, 'bulletList', track_warnings
+        )
+        warnings.extend(list_warnings)
+        content.append({'type': 'bulletList', 'content': list_content})
+    return i
+
+
+def _convert_ordered_list_block(
+    tokens: list, i: int, content: list[dict], warnings: list[str], track_warnings: bool
+) -> int:
+    list_content, i, list_warnings = _convert_list_tokens(tokens, i, 'orderedList', track_warnings)
+    warnings.extend(list_warnings)
+    content.append({'type': 'orderedList', 'content': list_content})
+    return i
+
+
+def _convert_fence_block(
+    tokens: list, i: int, content: list[dict], warnings: list[str], track_warnings: bool
+) -> int:
+    token = tokens[i]
+    attrs: dict[str, str] = {}
+
+    if token.info:
+        attrs['language'] = token.info
+    content.append(
+        {
+            'type': 'codeBlock',
+            'attrs': attrs,
+            'content': [{'type': 'text', 'text': token.content}],
+        }
+    )
+    return i + 1
+
+
+def _convert_table_block(
+    tokens: list, i: int, content: list[dict], warnings: list[str], track_warnings: bool
+) -> int:
+    table_node, i, table_warnings = _convert_table_tokens(tokens, i, track_warnings)
+    warnings.extend(table_warnings)
+    content.append(table_node)
+    return i
+
+
+# Token types without a handler that are consumed silently instead of reported as unsupported.
+_SILENT_BLOCK_TOKEN_TYPES = frozenset(
+    {
+        'inline',
+        'paragraph_close',
+        'heading_close',
+        'bullet_list_close',
+        'ordered_list_close',
+        'list_item_close',
+        'blockquote_close',
+        'softbreak',
+        'hardbreak',
+    }
+)
+_SILENT_INLINE_TOKEN_TYPES = frozenset({'softbreak', 'hardbreak'})
+
+# Block-level token handlers used by `_convert_tokens_to_adf`. Each handler appends the
+# converted node(s) to `content`, collects warnings, and returns the next token index.
+_BLOCK_TOKEN_HANDLERS: dict[str, Callable[[list, int, list[dict], list[str], bool], int]] = {
+    'heading_open': _convert_heading_block,
+    'paragraph_open': _convert_paragraph_block,
+    'blockquote_open': _convert_blockquote_block,
+    'hr': _convert_rule_block,
+    'bullet_list_open': _convert_bullet_list_block,
+    'ordered_list_open': _convert_ordered_list_block,
+    'fence': _convert_fence_block,
+    'table_open': _convert_table_block,
+}
+
+
 def _convert_tokens_to_adf(
     tokens: list, track_warnings: bool = False
-) -> list[dict] | tuple[list[dict], list[str]]:
+) -> tuple[list[dict], list[str]]:
     """Convert markdown-it tokens to ADF content nodes.
 
+    Warnings raised while converting nested content are always collected; only the
+    reporting of unsupported elements depends on `track_warnings`, so the converters
+    share one code path for both modes.
+
     Args:
         tokens: List of markdown-it Token objects
-        track_warnings: If True, returns tuple of (content, warnings)
+        track_warnings: If True, reports unsupported elements as warnings
 
     Returns:
-        List of ADF content nodes, or tuple of (content, warnings) if track_warnings=True
+        Tuple of (content, warnings)
     """
     content = []
     warnings: list[str] = []
     unsupported_types = set()
     i = 0
+    token_count = len(tokens)
 
-    while i < len(tokens):
+    while i < token_count:
         token = tokens[i]
 
-        if token.type == 'heading_open':
-            level = int(token.tag[1])
-            i += 1
-            inline_token = tokens[i]
-            if track_warnings:
-                heading_content, inline_warnings = _convert_inline_token_children(
-                    inline_token,
-                    track_warnings=True,
-                )
-                warnings.extend(inline_warnings)
-            else:
-                heading_content, _ = _convert_inline_token_children(inline_token)
-            content.append(
-                {'type': 'heading', 'attrs': {'level': level}, 'content': heading_content}
-            )
-            i += 2
+        handler = _BLOCK_TOKEN_HANDLERS.get(token.type)
+        if handler is not None:
+            i = handler(tokens, i, content, warnings, track_warnings)
+            continue
 
-        elif token.type == 'paragraph_open':
-            i += 1
-            _append_paragraph_from_inline_token(
-                tokens[i],
-                target_content=content,
-                warnings=warnings,
-                track_warnings=track_warnings,
+        if track_warnings and token.type not in _SILENT_BLOCK_TOKEN_TYPES:
+            type_name = (
+                token.type.replace('_', ' ').replace('open', '').replace('close', '').strip()
             )
-            i += 2
-
-        elif token.type == 'blockquote_open':
-            if track_warnings:
-                blockquote_result = cast(
-                    tuple[dict, int, list[str]],
-                    _convert_blockquote_tokens(tokens, i, track_warnings=True),
-                )
-                blockquote_node, i, blockquote_warnings = blockquote_result
-                warnings.extend(blockquote_warnings)
-            else:
-                blockquote_result = cast(tuple[dict, int], _convert_blockquote_tokens(tokens, i))
-                blockquote_node, i = blockquote_result
-            content.append(blockquote_node)
-
-        elif token.type == 'hr':
-            content.append({'type': 'rule'})
-            i += 1
-
-        elif token.type == 'bullet_list_open':
-            is_task_list = _is_task_list(tokens, i)
-
-            if is_task_list:
-                if track_warnings:
-                    list_result = cast(
-                        tuple[list[dict], int, list[str]],
-                        _convert_task_list_tokens(tokens, i, track_warnings=True),
-                    )
-                    list_content, i, list_warnings = list_result
-                    warnings.extend(list_warnings)
-                else:
-                    list_result = cast(tuple[list[dict], int], _convert_task_list_tokens(tokens, i))
-                    list_content, i = list_result
-                content.append(
-                    {'type': 'taskList', 'attrs': {'localId': ''}, 'content': list_content}
-                )
-            else:
-                if track_warnings:
-                    list_result = cast(
-                        tuple[list[dict], int, list[str]],
-                        _convert_list_tokens(tokens, i, 'bulletList', track_warnings=True),
-                    )
-                    list_content, i, list_warnings = list_result
-                    warnings.extend(list_warnings)
-                else:
-                    list_result = cast(
-                        tuple[list[dict], int], _convert_list_tokens(tokens, i, 'bulletList')
-                    )
-                    list_content, i = list_result
-                content.append({'type': 'bulletList', 'content': list_content})
-
-        elif token.type == 'ordered_list_open':
-            if track_warnings:
-                list_result = cast(
-                    tuple[list[dict], int, list[str]],
-                    _convert_list_tokens(tokens, i, 'orderedList', track_warnings=True),
-                )
-                list_content, i, list_warnings = list_result
-                warnings.extend(list_warnings)
-            else:
-                list_result = cast(
-                    tuple[list[dict], int], _convert_list_tokens(tokens, i, 'orderedList')
-                )
-                list_content, i = list_result
-            content.append({'type': 'orderedList', 'content': list_content})
-
-        elif token.type == 'fence':
-            attrs: dict[str, str] = {}
-
-            if token.info:
-                attrs['language'] = token.info
-            code_node = {
-                'type': 'codeBlock',
-                'attrs': attrs,
-                'content': [{'type': 'text', 'text': token.content}],
-            }
-            content.append(code_node)
-            i += 1
-
-        elif token.type == 'table_open':
-            if track_warnings:
-                table_result = cast(
-                    tuple[dict, int, list[str]],
-                    _convert_table_tokens(tokens, i, track_warnings=True),
-                )
-                table_node, i, table_warnings = table_result
-                warnings.extend(table_warnings)
-            else:
-                table_result = cast(tuple[dict, int], _convert_table_tokens(tokens, i))
-                table_node, i = table_result
-            content.append(table_node)
-
-        else:
-            if track_warnings and token.type not in [
-                'inline',
-                'paragraph_close',
-                'heading_close',
-                'bullet_list_close',
-                'ordered_list_close',
-                'list_item_close',
-                'blockquote_close',
-                'softbreak',
-                'hardbreak',
-            ]:
-                type_name = (
-                    token.type.replace('_', ' ').replace('open', '').replace('close', '').strip()
-                )
-                if type_name and type_name not in unsupported_types:
-                    unsupported_types.add(type_name)
-                    warnings.append(f'Unsupported markdown element: {type_name}')
-            i += 1
-
-    return (content, warnings) if track_warnings else content
-
-
-def _convert_nested_list_tokens(
-    tokens: list,
-    index: int,
-    list_type: str,
-    *,
-    track_warnings: bool,
-) -> tuple[list[dict], int, list[str]]:
-    if track_warnings:
-        nested_result = cast(
-            tuple[list[dict], int, list[str]],
-            _convert_list_tokens(tokens, index, list_type, track_warnings=True),
-        )
-        nested_content, next_index, nested_warnings = nested_result
-        return nested_content, next_index, nested_warnings
-
-    nested_result = cast(
-        tuple[list[dict], int],
-        _convert_list_tokens(tokens, index, list_type),
-    )
-    nested_content, next_index = nested_result
-    return nested_content, next_index, []
-
-
-def _convert_paragraph_inline_content(
-    inline_token: object, *, track_warnings: bool
-) -> tuple[list[dict], list[str]]:
-    if track_warnings:
-        para_content, inline_warnings = _convert_inline_token_children(
-            inline_token,
-            track_warnings=True,
-        )
-        return para_content, inline_warnings
+            if type_name and type_name not in unsupported_types:
+                unsupported_types.add(type_name)
+                warnings.append(f'Unsupported markdown element: {type_name}')
+        i += 1
 
-    para_content, _ = _convert_inline_token_children(inline_token)
-    return para_content, []
+    return (content, warnings)
 
 
 def _append_paragraph_from_inline_token(
@@ -1630,110 +1651,153 @@ def _append_paragraph_from_inline_token(
     warnings: list[str],
     track_warnings: bool,
 ) -> None:
-    para_content, inline_warnings = _convert_paragraph_inline_content(
+    para_content, inline_warnings = _convert_inline_token_children(
         inline_token,
         track_warnings=track_warnings,
     )
     warnings.extend(inline_warnings)
     if para_content:
-        target_content.append({'type': 'paragraph', 'content': para_content})
+        target_content.append(_build_paragraph_node(para_content))
+
+
+@dataclass
+class _ListFrame:
+    """A list being built by `_convert_list_tokens`, with its currently open item."""
+
+    list_type: str
+    close_type: str
+    list_items: list[dict] = field(default_factory=list)
+    item_content: list[dict] | None = None
+
+
+_LIST_CLOSE_TOKEN_TYPES = {
+    'bulletList': 'bullet_list_close',
+    'orderedList': 'ordered_list_close',
+}
+
+
+def _open_list_frame(list_type: str) -> _ListFrame:
+    return _ListFrame(list_type, _LIST_CLOSE_TOKEN_TYPES[list_type])
 
 
 def _convert_list_tokens(
     tokens: list, start_index: int, list_type: str, track_warnings: bool = False
-) -> tuple[list[dict], int] | tuple[list[dict], int, list[str]]:
+) -> tuple[list[dict], int, list[str]]:
     """Convert markdown list tokens to ADF list items.
 
+    Nested lists are built iteratively with an explicit stack of open lists, so
+    deeply nested Markdown does not recurse.
+
     Args:
         tokens: List of markdown-it Token objects
         start_index: Starting index in tokens list
         list_type: 'bulletList' or 'orderedList'
-        track_warnings: If True, returns tuple of (list_items, end_index, warnings)
+        track_warnings: If True, reports unsupported inline elements as warnings
 
     Returns:
-        Tuple of (list_items, end_index), or (list_items, end_index, warnings) if track_warnings=True
+        Tuple of (list_items, end_index, warnings)
     """
-    list_items = []
     warnings: list[str] = []
+    root = _open_list_frame(list_type)
+    stack = [root]
     i = start_index + 1
 
     while i < len(tokens):
+        frame = stack[-1]
+        item_content = frame.item_content
         token = tokens[i]
 
-        if token.type == f'{list_type.replace("List", "")}_list_close':
-            break
-        elif token.type == 'list_item_open':
+        if item_content is None:
+            if token.type == frame.close_type:
+                stack.pop()
+                if not stack:
+                    break
+                parent_content = cast(list[dict], stack[-1].item_content)
+                parent_content.append({'type': frame.list_type, 'content': frame.list_items})
+            elif token.type == 'list_item_open':
+                frame.item_content = []
             i += 1
-            item_content = []
 
-            while i < len(tokens) and tokens[i].type != 'list_item_close':
-                inner_token = tokens[i]
-
-                if inner_token.type == 'paragraph_open':
-                    i += 1
-                    _append_paragraph_from_inline_token(
-                        tokens[i],
-                        target_content=item_content,
-                        warnings=warnings,
-                        track_warnings=track_warnings,
-                    )
-                    i += 2
+        elif token.type == 'list_item_close':
+            frame.list_items.append({'type': 'listItem', 'content': item_content})
+            frame.item_content = None
+            i += 1
 
-                elif inner_token.type == 'bullet_list_open':
-                    nested_content, i, nested_warnings = _convert_nested_list_tokens(
-                        tokens,
-                        i,
-                        'bulletList',
-                        track_warnings=track_warnings,
-                    )
-                    warnings.extend(nested_warnings)
-                    item_content.append({'type': 'bulletList', 'content': nested_content})
-
-                elif inner_token.type == 'ordered_list_open':
-                    nested_content, i, nested_warnings = _convert_nested_list_tokens(
-                        tokens,
-                        i,
-                        'orderedList',
-                        track_warnings=track_warnings,
-                    )
-                    warnings.extend(nested_warnings)
-                    item_content.append({'type': 'orderedList', 'content': nested_content})
+        elif token.type == 'paragraph_open':
+            _append_paragraph_from_inline_token(
+                tokens[i + 1],
+                target_content=item_content,
+                warnings=warnings,
+                track_warnings=track_warnings,
+            )
+            i += 3
 
-                else:
-                    i += 1
+        elif token.type == 'bullet_list_open':
+            stack.append(_open_list_frame('bulletList'))
+            i += 1
 
-            list_items.append({'type': 'listItem', 'content': item_content})
+        elif token.type == 'ordered_list_open':
+            stack.append(_open_list_frame('orderedList'))
             i += 1
 
         else:
             i += 1
 
-    if track_warnings:
-        return (list_items, i + 1, warnings)
-    else:
-        return (list_items, i + 1)
+    # Close whatever is still open when the tokens run out.
+    while stack:
+        frame = stack.pop()
+        if frame.item_content is not None:
+            frame.list_items.append({'type': 'listItem', 'content': frame.item_content})
+        if stack:
+            parent_content = cast(list[dict], stack[-1].item_content)
+            parent_content.append({'type': frame.list_type, 'content': frame.list_items})
+
+    return (root.list_items, i + 1, warnings)
+
+
+_MENTION_HREF_PATTERN = re.compile(r'/jira/people/([^/]+)$')
+
+# Active inline marks are tracked as one integer holding an 8-bit nesting depth per
+# mark type, so opening and closing a mark is a single addition or subtraction.
+_MARK_DEPTH_MASK = 0xFF
+_MARK_SHIFTS = (('strong', 0), ('em', 8), ('strike', 16))
+_MARK_OPEN_TOKEN_SHIFTS = {'strong_open': 0, 'em_open': 8, 's_open': 16}
+_MARK_CLOSE_TOKEN_SHIFTS = {'strong_close': 0, 'em_close': 8, 's_close': 16}
+_MARK_TYPES_BY_STATE: dict[int, tuple[str, ...]] = {}
+
+
+def _build_marks(active_marks: int) -> list[dict]:
+    mark_types = _MARK_TYPES_BY_STATE.get(active_marks)
+    if mark_types is None:
+        mark_types = tuple(
+            mark_type
+            for mark_type, shift in _MARK_SHIFTS
+            if (active_marks >> shift) & _MARK_DEPTH_MASK
+        )
+        _MARK_TYPES_BY_STATE[active_marks] = mark_types
+    return [{'type': mark_type} for mark_type in mark_types]
 
 
 def _convert_inline_tokens(
     tokens: list, track_warnings: bool = False
-) -> list[dict] | tuple[list[dict], list[str]]:
+) -> tuple[list[dict], list[str]]:
     """Convert markdown-it inline tokens to ADF text nodes with marks.
 
     Args:
         tokens: List of markdown-it inline Token objects
-        track_warnings: If True, returns tuple of (content, warnings)
+        track_warnings: If True, reports unsupported inline elements as warnings
 
     Returns:
-        List of ADF text nodes, or tuple of (content, warnings) if track_warnings=True
+        Tuple of (content, warnings)
     """
     if not tokens:
-        return ([], []) if track_warnings else []
+        return ([], [])
 
     content = []
     warnings: list[str] = []
     unsupported_types = set()
     i = 0
-    active_marks = []
+    active_marks = 0
 
     while i < len(tokens):
         token = tokens[i]
@@ -1741,24 +1805,16 @@ def _convert_inline_tokens(
         if token.type == 'text':
             text_node = {'type': 'text', 'text': token.content}
             if active_marks:
-                text_node['marks'] = [{'type': mark} for mark in active_marks]
+                text_node['marks'] = _build_marks(active_marks)
             content.append(text_node)
             i += 1
 
-        elif token.type == 'strong_open':
-            active_marks.append('strong')
-            i += 1
-        elif token.type == 'strong_close':
-            if 'strong' in active_marks:
-                active_marks.remove('strong')
-            i += 1
-
-        elif token.type == 'em_open':
-            active_marks.append('em')
+        elif (shift := _MARK_OPEN_TOKEN_SHIFTS.get(token.type)) is not None:
+            active_marks += 1 << shift
             i += 1
-        elif token.type == 'em_close':
-            if 'em' in active_marks:
-                active_marks.remove('em')
+        elif (shift := _MARK_CLOSE_TOKEN_SHIFTS.get(token.type)) is not None:
+            if (active_marks >> shift) & _MARK_DEPTH_MASK:
+                active_marks -= 1 << shift
             i += 1
 
         elif token.type == 'code_inline':
@@ -1774,7 +1830,7 @@ def _convert_inline_tokens(
                     )
                     date_node: dict = {'type': 'date', 'attrs': {'timestamp': timestamp_ms}}
                     if active_marks:
-                        date_node['marks'] = [{'type': mark} for mark in active_marks]
+                        date_node['marks'] = _build_marks(active_marks)
                     content.append(date_node)
                 except ValueError:
                     text_node = {
@@ -1792,13 +1848,14 @@ def _convert_inline_tokens(
             href = token.attrGet('href')
             i += 1
 
-            link_text = ''
+            link_text_parts = []
             while i < len(tokens) and tokens[i].type != 'link_close':
                 if tokens[i].type == 'text':
-                    link_text += tokens[i].content
+                    link_text_parts.append(tokens[i].content)
                 i += 1
+            link_text = ''.join(link_text_parts)
 
-            mention_match = re.search(r'/jira/people/([^/]+)$', href or '')
+            mention_match = _MENTION_HREF_PATTERN.search(href or '')
             if mention_match:
                 account_id = mention_match.group(1)
                 mention_node = {
@@ -1818,16 +1875,8 @@ def _convert_inline_tokens(
                 content.append(text_node)
             i += 1
 
-        elif token.type == 's_open':
-            active_marks.append('strike')
-            i += 1
-        elif token.type == 's_close':
-            if 'strike' in active_marks:
-                active_marks.remove('strike')
-            i += 1
-
         else:
-            if track_warnings and token.type not in ['softbreak', 'hardbreak']:
+            if track_warnings and token.type not in _SILENT_INLINE_TOKEN_TYPES:
                 type_name = (
                     token.type.replace('_', ' ').replace('open', '').replace('close', '').strip()
                 )
@@ -1836,7 +1885,7 @@ def _convert_inline_tokens(
                     warnings.append(f'Unsupported inline markdown: {type_name}')
             i += 1
 
-    return (content, warnings) if track_warnings else content
+    return (content, warnings)
 
 
 def _convert_inline_token_children(
@@ -1844,19 +1893,7 @@ def _convert_inline_token_children(
     *,
     track_warnings: bool = False,
 ) -> tuple[list[dict], list[str]]:
-    if track_warnings:
-        return cast(
-            tuple[list[dict], list[str]],
-            _convert_inline_tokens(
-                inline_token.children if inline_token.children else [],
-                track_warnings=True,
-            ),
-        )
-
-    return (
-        cast(
-            list[dict],
-            _convert_inline_tokens(inline_token.children) if inline_token.children else [],
-        ),
-        [],
-    )
+    children = inline_token.children
+    if not children:
+        return ([], [])
+    return _convert_inline_tokens(children, track_warnings)
@@ -9,10 +9,22 @@ from __future__ import annotations
 import re
 
 from markdown_it import MarkdownIt
+from markdown_it.rules_core import StateCore
 from markdown_it.token import Token
 
 from gojeera.utils.markdown.mdit_token_utils import build_labeled_paragraph_tokens
 
+_DECISION_MARKER_PREFIX = '[decision:'
+_DECISION_MARKER_PATTERN = re.compile(r'\[decision:([dau])\]')
+_DECISION_MARKER_PREFIX_PATTERN = re.compile(r'^\[decision:[dau]\]')
+
+# Map decision state codes to display labels
+_DECISION_LABELS = {
+    'd': 'DECIDED',
+    'a': 'ACKNOWLEDGED',
+    'u': 'UP FOR DISCUSSION',
+}
+
 
 def decision_plugin(md: MarkdownIt) -> None:
     """Detect and transform decision item blockquotes.
@@ -20,60 +32,77 @@ def decision_plugin(md: MarkdownIt) -> None:
     See docs/markdown_to_adf_conversion.md for details.
     """
 
-    # Map decision state codes to display labels
-    DECISION_LABELS = {
-        'd': 'DECIDED',
-        'a': 'ACKNOWLEDGED',
-        'u': 'UP FOR DISCUSSION',
-    }
-
-    def process_tokens(tokens):
+    def process_tokens(state: StateCore) -> None:
+        tokens = state.tokens
+        # Close indices are computed once against the original token positions.
+        # Splits only happen inside a processed blockquote, so `offset` maps any
+        # later index back to the original positions, and a blockquote opened
+        # inside a processed one shares its close (first-close semantics).
+        close_indices = find_blockquote_closes(tokens)
+        offset = 0
+        processed_close_idx = -1
         i = 0
         while i < len(tokens):
             token = tokens[i]
 
             # Check if this is a blockquote
             if token.type == 'blockquote_open':
-                # Look ahead to find the content tokens
                 # Structure: blockquote_open, [...content tokens...], blockquote_close
-                if i + 1 < len(tokens):
-                    # Find blockquote_close index
-                    close_idx = find_blockquote_close(tokens, i + 1)
+                if i < processed_close_idx:
+                    close_idx = processed_close_idx
+                else:
+                    close_idx = close_indices.get(i - offset, -1)
                     if close_idx > 0:
-                        # Check if this blockquote contains decisions
-                        if has_decision_patterns(tokens, i + 1, close_idx):
-                            # Add 'decision' class to the blockquote token
-                            if not hasattr(token, 'attrs') or token.attrs is None:
-                                token.attrs = {}
-                            token.attrs['class'] = 'decision'
-                            # Process all decision paragraphs in this blockquote
-                            process_decision_blockquote(tokens, i + 1, close_idx)
-
-            # Recursively process children
-            if hasattr(token, 'children') and token.children:
-                process_tokens(token.children)
+                        close_idx += offset
+                if close_idx > 0:
+                    # Check if this blockquote contains decisions
+                    if has_decision_patterns(tokens, i + 1, close_idx):
+                        # Add 'decision' class to the blockquote token
+                        token.attrSet('class', 'decision')
+                        # Process all decision paragraphs in this blockquote
+                        token_count = len(tokens)
+                        process_decision_blockquote(tokens, i + 1, close_idx)
+                        shift = len(tokens) - token_count
+                        offset += shift
+                        processed_close_idx = close_idx + shift
 
             i += 1
 
-    def find_blockquote_close(tokens, start_index):
-        for i in range(start_index, len(tokens)):
-            if tokens[i].type == 'blockquote_close':
-                return i
-        return -1
+    def find_blockquote_closes(tokens):
+        # Map each blockquote_open index to the first blockquote_close after it
+        close_indices = {}
+        next_close_idx = -1
+        for i in range(len(tokens) - 1, -1, -1):
+            token_type = tokens[i].type
+            if token_type == 'blockquote_close':
+                next_close_idx = i
+            elif token_type == 'blockquote_open':
+                close_indices[i] = next_close_idx
+        return close_indices
 
     def has_decision_patterns(tokens, start_idx, end_idx):
         for i in range(start_idx, end_idx):
             token = tokens[i]
-            if token.type == 'inline' and hasattr(token, 'children') and token.children:
-                for child in token.children:
-                    if child.type == 'code_inline':
-                        content = getattr(child, 'content', '')
-                        if re.match(r'\[decision:[dau]\]', content):
-                            return True
+            if token.type != 'inline':
+                continue
+            children = token.children
+            if not children:
+                continue
+            for child in children:
+                if child.type != 'code_inline':
+                    continue
+                content = child.content
+                if not content.startswith(_DECISION_MARKER_PREFIX):
+                    continue
+                if _DECISION_MARKER_PATTERN.match(content):
+                    return True
         return False
 
     def process_decision_blockquote(tokens, start_idx, end_idx):
-        # Find all paragraphs with decision patterns
+        # Collect every split first and splice afterwards, so each paragraph is
+        # replaced once and the indices found during the scan stay valid
+        replacements = []
+        last_close_idx = -1
         i = start_idx
         while i < end_idx:
             token = tokens[i]
@@ -84,29 +113,58 @@ def decision_plugin(md: MarkdownIt) -> None:
                 for child_idx, child in enumerate(token.children):
                     if child.type == 'code_inline':
                         content = getattr(child, 'content', '')
-                        match = re.match(r'\[decision:([dau])\]', content)
+                        if not content.startswith(_DECISION_MARKER_PREFIX):
+                            continue
+                        match = _DECISION_MARKER_PATTERN.match(content)
                         if match:
                             state_code = match.group(1)
                             # Found a decision - split this paragraph
                             para_open_idx, para_close_idx = find_paragraph_bounds(
                                 tokens, i, start_idx, end_idx
                             )
+                            if replacements and para_open_idx <= last_close_idx:
+                                # Bounds reaching back into an earlier split must see
+                                # its tokens, so splice the pending splits first
+                                shift = apply_replacements(tokens, replacements)
+                                replacements = []
+                                i += shift
+                                end_idx += shift
+                                para_open_idx, para_close_idx = find_paragraph_bounds(
+                                    tokens, i, start_idx, end_idx
+                                )
                             if para_open_idx >= 0 and para_close_idx >= 0:
-                                # Split the paragraph
                                 new_tokens = create_decision_paragraph_split(
                                     tokens, para_open_idx, i, child_idx, state_code
                                 )
-                                # Replace original paragraph with split version
-                                replace_end = para_close_idx + 1
-                                tokens[para_open_idx:replace_end] = new_tokens
-                                # Adjust indices: we added tokens (label para has 3 tokens)
-                                adjustment = len(new_tokens) - (para_close_idx - para_open_idx + 1)
-                                end_idx += adjustment
-                                i = para_open_idx + len(new_tokens) - 1
+                                replacements.append((para_open_idx, para_close_idx, new_tokens))
+                                last_close_idx = para_close_idx
+                                i = para_close_idx
                             break  # Process next inline token
             i += 1
 
+        apply_replacements(tokens, replacements)
+
+    def apply_replacements(tokens, replacements):
+        # Splice from the end so earlier indices are not shifted
+        shift = 0
+        for para_open_idx, para_close_idx, new_tokens in reversed(replacements):
+            tokens[para_open_idx : para_close_idx + 1] = new_tokens
+            shift += len(new_tokens) - (para_close_idx - para_open_idx + 1)
+        return shift
+
     def find_paragraph_bounds(tokens, inline_idx, start_idx, end_idx):
+        # Paragraph inline tokens sit directly between their open and close tokens
+        open_idx = inline_idx - 1
+        close_idx = inline_idx + 1
+        if (
+            start_idx <= open_idx
+            and close_idx <= end_idx
+            and close_idx < len(tokens)
+            and tokens[open_idx].type == 'paragraph_open'
+            and tokens[close_idx].type == 'paragraph_close'
+        ):
+            return open_idx, close_idx
+
         # Search backwards for paragraph_open
         para_open_idx = -1
         for j in range(inline_idx - 1, max(start_idx - 1, -1), -1):
@@ -125,7 +183,7 @@ def decision_plugin(md: MarkdownIt) -> None:
 
     def create_decision_paragraph_split(tokens, para_open_idx, inline_idx, child_idx, state_code):
         inline_token = tokens[inline_idx]
-        label = f'DECISION {DECISION_LABELS.get(state_code, "DECIDED")}'
+        label = f'DECISION {_DECISION_LABELS[state_code]}'
 
         # Copy children but remove the [decision:x] marker from code_inline
         new_children = []
@@ -133,7 +191,7 @@ def decision_plugin(md: MarkdownIt) -> None:
             if idx == child_idx and child.type == 'code_inline':
                 # Extract text after [decision:x]
                 content = getattr(child, 'content', '')
-                text_after = re.sub(r'^\[decision:[dau]\]', '', content)
+                text_after = _DECISION_MARKER_PREFIX_PATTERN.sub('', content)
                 if text_after:
                     # Create a plain text token instead of code_inline
                     text_token = Token('text', '', 0)
@@ -146,13 +204,8 @@ def decision_plugin(md: MarkdownIt) -> None:
             paragraph_map=tokens[para_open_idx].map,
             inline_map=inline_token.map,
             content_children=new_children,
-            content_text=''.join(
-                getattr(child, 'content', '') for child in new_children if child.type == 'text'
-            ),
+            content_text=''.join([child.content for child in new_children if child.type == 'text']),
         )
 
     # Add the core rule to process tokens after parsing
-    def decision_rule(state):
-        process_tokens(state.tokens)
-
-    md.core.ruler.after('inline', 'decision', decision_rule)
+    md.core.ruler.after('inline', 'decision', process_tokens)
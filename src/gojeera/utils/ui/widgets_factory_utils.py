@@ -23,6 +23,8 @@ from gojeera.widgets.work_item.work_item_labels import WorkItemLabels
 
 logger = logging.getLogger('gojeera')
 
+_UPDATE_OPERATIONS = frozenset({'set', 'add', 'edit', 'remove'})
+
 
 def apply_field_control_classes(widget: Widget) -> Widget:
     if not widget.has_class('field_control'):
@@ -134,12 +136,13 @@ class DynamicFieldWrapper(Horizontal):
         self._title = title
         self._required = required
         self._widget_class = widget_class
+        self._update_value_getter: Callable[[], Any] | None = None
+        self._create_value_getter: Callable[[], Any] | None = None
         self.tooltip = tooltip
 
     def materialize(self) -> None:
         if self._label is None:
-            label = Label(self._title)
-            label.add_class('field_label')
+            label = Label(self._title, classes='field_label')
             label.tooltip = self.tooltip
             self._label = label
 
@@ -147,6 +150,12 @@ class DynamicFieldWrapper(Horizontal):
             self._widget = self._widget_factory()
             apply_field_control_classes(self._widget)
             self._widget.tooltip = self.tooltip
+            self._update_value_getter = self._bind_value_getter('get_value_for_update')
+            self._create_value_getter = self._bind_value_getter('get_value_for_create')
+
+    def _bind_value_getter(self, name: str) -> Callable[[], Any] | None:
+        method = getattr(self._widget, name, None)
+        return method if callable(method) else None
 
     def compose(self) -> ComposeResult:
         self.materialize()
@@ -186,20 +195,15 @@ class DynamicFieldWrapper(Horizontal):
         return False
 
     def update_label_styling(self) -> None:
-        try:
-            from textual.widgets import Label
-
-            label = self.query_one(Label)
-
-            widget_enabled = self.update_enabled
-            has_changed = self.value_has_changed
+        if self._label is None:
+            return
 
-            if widget_enabled and has_changed:
-                label.add_class('pending_field_label')
-            else:
-                label.remove_class('pending_field_label')
+        try:
+            has_pending_change = self.update_enabled and self.value_has_changed
         except Exception:
-            pass
+            return
+
+        self._label.set_class(bool(has_pending_change), 'pending_field_label')
 
     def update_metadata(
         self,
@@ -229,21 +233,17 @@ class DynamicFieldWrapper(Horizontal):
                     pass
 
     def get_value_for_update(self):
-        if self._widget:
+        if self._update_value_getter is not None:
             try:
-                method = getattr(self._widget, 'get_value_for_update', None)
-                if callable(method):
-                    return method()
+                return self._update_value_getter()
             except AttributeError:
                 pass
         return None
 
     def get_value_for_create(self):
-        if self._widget:
+        if self._create_value_getter is not None:
             try:
-                method = getattr(self._widget, 'get_value_for_create', None)
-                if callable(method):
-                    return method()
+                return self._create_value_getter()
             except AttributeError:
                 pass
         return None
@@ -254,6 +254,25 @@ class FieldMetadata:
     Parsed field metadata from Jira metadata.
     """
 
+    __slots__ = (
+        '_options',
+        'allowed_values',
+        'custom_type',
+        'default_value',
+        'description',
+        'field_id',
+        'has_default',
+        'is_custom_field',
+        'key',
+        'name',
+        'operations',
+        'raw',
+        'required',
+        'schema',
+        'schema_type',
+        'supports_update',
+    )
+
     def __init__(self, raw_metadata: dict):
         """
         Initialize from raw Jira field metadata.
@@ -261,27 +280,31 @@ class FieldMetadata:
         Args:
             raw_metadata: Dictionary from Jira's create or edit metadata
         """
+        get = raw_metadata.get
+        schema: dict = get('schema', {})
         self.raw = raw_metadata
-        self.field_id: str = raw_metadata.get('fieldId', '')
-        self.name: str = raw_metadata.get('name', '')
-        self.description: str | None = raw_metadata.get('description')
-        self.key: str = raw_metadata.get('key', '')
-        self.required: bool = raw_metadata.get('required', False)
-        self.schema: dict = raw_metadata.get('schema', {})
-        self.custom_type: str | None = self.schema.get('custom')
-        self.schema_type: str = self.schema.get('type', '')
-        self.allowed_values: list[dict] = raw_metadata.get('allowedValues', [])
-        self.has_default: bool = raw_metadata.get('hasDefaultValue', False)
-        self.default_value: dict | None = raw_metadata.get('defaultValue')
-        self.operations: list[str] = raw_metadata.get('operations', [])
+        self.field_id: str = get('fieldId', '')
+        self.name: str = get('name', '')
+        self.description: str | None = get('description')
+        self.key: str = get('key', '')
+        self.required: bool = get('required', False)
+        self.schema = schema
+        self.custom_type: str | None = schema.get('custom')
+        self.schema_type: str = schema.get('type', '')
+        self.allowed_values: list[dict] = get('allowedValues', [])
+        self.has_default: bool = get('hasDefaultValue', False)
+        self.default_value: dict | None = get('defaultValue')
+        self.operations: list[str] = get('operations', [])
+        self.supports_update: bool = not _UPDATE_OPERATIONS.isdisjoint(self.operations)
+        self.is_custom_field: bool = self.custom_type is not None
+        self._options: list[tuple[str, str]] | None = None
 
     @property
-    def supports_update(self) -> bool:
-        return any(op in self.operations for op in ['set', 'add', 'edit', 'remove'])
-
-    @property
-    def is_custom_field(self) -> bool:
-        return self.custom_type is not None
+    def options(self) -> list[tuple[str, str]]:
+        """Select-compatible options parsed once from `allowed_values`."""
+        if self._options is None:
+            self._options = AllowedValuesParser.parse_options(self.allowed_values or [])
+        return self._options
 
     def __repr__(self) -> str:
         return f'FieldMetadata(field_id={self.field_id!r}, name={self.name!r}, custom_type={self.custom_type!r})'
@@ -329,10 +352,10 @@ class AllowedValuesParser:
         Returns:
             List of (display_name, id) tuples for Select widget
         """
-        options: list[tuple[str, str]] = []
-
         if not allowed_values:
-            return options
+            return []
+
+        options: list[tuple[str, str]] = []
         for value in allowed_values:
             if 'languageCode' in value and 'displayName' in value:
                 display_value = value.get('displayName', '')
@@ -689,7 +712,7 @@ class WidgetBuilder:
         current_value: list[Any] | None = None,
     ) -> Widget:
         def create_widget():
-            options = AllowedValuesParser.parse_options(metadata.allowed_values or [])
+            options = metadata.options
             name_to_id = dict(options)
             current_ids = []
             if current_value:
@@ -776,83 +799,90 @@ def _field_data_summary(field_data: dict[str, Any]) -> tuple[str, str, str, bool
     )
 
 
-def map_field_to_widget(
+def _build_unsupported_custom_field(
     mode: FieldMode,
     metadata: FieldMetadata,
     current_value: Any = None,
-) -> Widget | None:
-    builder = WidgetBuilder()
-
-    if metadata.is_custom_field:
-        custom_type = metadata.custom_type
-
-        if custom_type == CustomFieldType.USER_PICKER.value:
-            return builder.build_user_picker(mode, metadata, current_value)
-
-        elif custom_type == CustomFieldType.FLOAT.value:
-            return builder.build_numeric(mode, metadata, current_value)
-
-        elif custom_type == CustomFieldType.SELECT.value:
-            if metadata.allowed_values:
-                options = AllowedValuesParser.parse_options(metadata.allowed_values)
-                return builder.build_selection(mode, metadata, options, current_value=current_value)
-
-        elif custom_type == CustomFieldType.DATE_PICKER.value:
-            return builder.build_date(mode, metadata, current_value)
+) -> Widget:
+    logger.warning(f'Unsupported custom field type: {metadata.custom_type} for {metadata.name}')
+    return WidgetBuilder.build_text(mode, metadata, current_value)
 
-        elif custom_type == CustomFieldType.DATETIME.value:
-            return builder.build_datetime(mode, metadata, current_value)
 
-        elif custom_type == CustomFieldType.TEXT_FIELD.value:
-            return builder.build_text(mode, metadata, current_value)
-
-        elif custom_type == CustomFieldType.URL.value:
-            return builder.build_url(mode, metadata, current_value)
-
-        elif custom_type == CustomFieldType.LABELS.value:
-            return builder.build_labels(mode, metadata, current_value)
+def _build_custom_selection(
+    mode: FieldMode,
+    metadata: FieldMetadata,
+    current_value: Any = None,
+) -> Widget:
+    if not metadata.allowed_values:
+        return _build_unsupported_custom_field(mode, metadata, current_value)
+    return WidgetBuilder.build_selection(
+        mode, metadata, metadata.options, current_value=current_value
+    )
 
-        elif custom_type == CustomFieldType.MULTI_CHECKBOXES.value or custom_type in (
-            CustomFieldType.MULTI_SELECT.value,
-            CustomFieldType.SD_CUSTOMER_ORGANIZATIONS.value,
-        ):
-            return builder.build_multicheckboxes(mode, metadata, current_value)
 
-        elif custom_type == CustomFieldType.SD_REQUEST_LANGUAGE.value:
-            if metadata.allowed_values:
-                options = AllowedValuesParser.parse_options(metadata.allowed_values)
-                return builder.build_selection(mode, metadata, options, current_value=current_value)
+def _build_custom_sprint(
+    mode: FieldMode,
+    metadata: FieldMetadata,
+    current_value: Any = None,
+) -> Widget:
+    # Check if sprint selection feature is enabled
+    config = CONFIGURATION.get()
+    if config.enable_sprint_selection:
+        sprint_ids = extract_sprint_ids(current_value)
 
-        elif custom_type == CustomFieldType.GH_EPIC_LINK.value:
-            return builder.build_text(mode, metadata, current_value)
+        return WidgetBuilder.build_sprint_selection(mode, metadata, sprint_ids or None)
+    # Fallback to text input if feature disabled
+    return WidgetBuilder.build_text(mode, metadata, current_value)
 
-        elif custom_type == CustomFieldType.GH_SPRINT.value:
-            # Check if sprint selection feature is enabled
-            config = CONFIGURATION.get()
-            if config.enable_sprint_selection:
-                sprint_ids = extract_sprint_ids(current_value)
 
-                return builder.build_sprint_selection(mode, metadata, sprint_ids or None)
-            else:
-                # Fallback to text input if feature disabled
-                return builder.build_text(mode, metadata, current_value)
+def _build_custom_textarea(
+    mode: FieldMode,
+    metadata: FieldMetadata,
+    current_value: Any = None,
+) -> Widget | None:
+    if mode == FieldMode.UPDATE:
+        return WidgetBuilder.build_adf_textarea(mode, metadata, current_value)
+    return None
+
+
+_CUSTOM_FIELD_BUILDERS: dict[str, Callable[[FieldMode, FieldMetadata, Any], Widget | None]] = {
+    CustomFieldType.USER_PICKER.value: WidgetBuilder.build_user_picker,
+    CustomFieldType.FLOAT.value: WidgetBuilder.build_numeric,
+    CustomFieldType.SELECT.value: _build_custom_selection,
+    CustomFieldType.DATE_PICKER.value: WidgetBuilder.build_date,
+    CustomFieldType.DATETIME.value: WidgetBuilder.build_datetime,
+    CustomFieldType.TEXT_FIELD.value: WidgetBuilder.build_text,
+    CustomFieldType.URL.value: WidgetBuilder.build_url,
+    CustomFieldType.LABELS.value: WidgetBuilder.build_labels,
+    CustomFieldType.MULTI_CHECKBOXES.value: WidgetBuilder.build_multicheckboxes,
+    CustomFieldType.MULTI_SELECT.value: WidgetBuilder.build_multicheckboxes,
+    CustomFieldType.SD_CUSTOMER_ORGANIZATIONS.value: WidgetBuilder.build_multicheckboxes,
+    CustomFieldType.SD_REQUEST_LANGUAGE.value: _build_custom_selection,
+    CustomFieldType.GH_EPIC_LINK.value: WidgetBuilder.build_text,
+    CustomFieldType.GH_SPRINT.value: _build_custom_sprint,
+    CustomFieldType.TEXTAREA.value: _build_custom_textarea,
+}
 
-        elif custom_type == CustomFieldType.TEXTAREA.value:
-            if mode == FieldMode.UPDATE:
-                return builder.build_adf_textarea(mode, metadata, current_value)
-            else:
-                return None
 
-        logger.warning(f'Unsupported custom field type: {custom_type} for {metadata.name}')
+def map_field_to_widget(
+    mode: FieldMode,
+    metadata: FieldMetadata,
+    current_value: Any = None,
+) -> Widget | None:
+    if metadata.is_custom_field:
+        build_custom_field = _CUSTOM_FIELD_BUILDERS.get(
+            cast('str', metadata.custom_type), _build_unsupported_custom_field
+        )
+        return build_custom_field(mode, metadata, current_value)
 
     else:
         schema_type = metadata.schema_type.lower()
 
         if schema_type == 'number':
-            return builder.build_numeric(mode, metadata, current_value)
+            return WidgetBuilder.build_numeric(mode, metadata, current_value)
 
         elif schema_type == 'date':
-            return builder.build_date(mode, metadata, current_value)
+            return WidgetBuilder.build_date(mode, metadata, current_value)
 
         elif (
             mode == FieldMode.CREATE
@@ -860,7 +890,7 @@ def map_field_to_widget(
             and metadata.schema.get('items') == 'string'
             and metadata.field_id == 'labels'
         ):
-            return builder.build_labels(mode, metadata, current_value)
+            return WidgetBuilder.build_labels(mode, metadata, current_value)
 
         elif (
             schema_type == 'array'
@@ -870,11 +900,12 @@ def map_field_to_widget(
                 or metadata.key in ('components', 'versions', 'fixVersions')
             )
         ):
-            return builder.build_multicheckboxes(mode, metadata, current_value)
+            return WidgetBuilder.build_multicheckboxes(mode, metadata, current_value)
 
         elif metadata.allowed_values:
-            options = AllowedValuesParser.parse_options(metadata.allowed_values)
-            return builder.build_selection(mode, metadata, options, current_value=current_value)
+            return WidgetBuilder.build_selection(
+                mode, metadata, metadata.options, current_value=current_value
+            )
 
         # Check if the current_value is an ADF document (dict with 'type': 'doc')
         # This handles fields like 'description' that contain ADF content
@@ -883,9 +914,9 @@ def map_field_to_widget(
             and isinstance(current_value, dict)
             and current_value.get('type') == 'doc'
         ):
-            return builder.build_adf_textarea(mode, metadata, current_value)
+            return WidgetBuilder.build_adf_textarea(mode, metadata, current_value)
 
-    return builder.build_text(mode, metadata, current_value)
+    return WidgetBuilder.build_text(mode, metadata, current_value)
 
 
 def build_dynamic_widgets(
@@ -906,12 +937,12 @@ def build_dynamic_widgets(
     for field_data in fields_data:
         field_id, field_key, field_name, required = _field_data_summary(field_data)
 
-        field_identifiers = {
-            str(field_id).lower(),
-            str(field_key).lower(),
-            str(field_name).lower(),
-        }
-        if any(fid in skip_fields_lower for fid in field_identifiers if fid):
+        field_id_lower = str(field_id).lower()
+        if skip_fields_lower and any(
+            fid in skip_fields_lower
+            for fid in (field_id_lower, str(field_key).lower(), str(field_name).lower())
+            if fid
+        ):
             continue
 
         has_current_value = any(
@@ -921,7 +952,7 @@ def build_dynamic_widgets(
         )
 
         if mode == FieldMode.CREATE and not required:
-            if str(field_id).lower() in skip_fields_lower:
+            if field_id_lower in skip_fields_lower:
                 continue
 
             if (
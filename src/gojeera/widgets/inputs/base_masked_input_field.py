@@ -1,7 +1,6 @@
 from collections.abc import Callable
-from typing import Any
+from datetime import datetime
 
-from dateutil.parser import isoparse
 from textual.validation import ValidationResult
 from textual.widgets import MaskedInput
 
@@ -19,7 +18,7 @@ from gojeera.widgets.inputs.masked_input_utils import (
 
 
 class BaseMaskedInputField(MaskedInput, BaseField, BaseUpdateField):
-    _strip_chars = ''
+    _strip_table: dict[int, int | None] = str.maketrans('', '', '_')
     _mask_template = ''
     _mask_placeholder = ''
     _mask_compact = False
@@ -60,16 +59,18 @@ class BaseMaskedInputField(MaskedInput, BaseField, BaseUpdateField):
             self.add_class(class_name)
 
     def validate(self, value: str) -> ValidationResult | None:
-        if allow_empty_masked_input_validation(self, value, strip_chars=self._strip_chars):
+        if allow_empty_masked_input_validation(self, value, strip_table=self._strip_table):
             return None
 
         return super().validate(value)
 
     @staticmethod
-    def _try_parse_update_value(value: str | None, formatter: Callable[[Any], str]) -> str | None:
+    def _try_parse_update_value(
+        value: str | None, formatter: Callable[[datetime], str]
+    ) -> str | None:
         if value and value.strip():
             try:
-                return formatter(isoparse(value))
+                return formatter(datetime.fromisoformat(value))
             except ValueError:
                 return None
         return None
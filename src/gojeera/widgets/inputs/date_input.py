@@ -5,7 +5,7 @@ from gojeera.widgets.inputs.base_masked_input_field import BaseMaskedInputField
 class DateInput(BaseMaskedInputField):
     """This widget extends MaskedInput with template '9999-99-99' (YYYY-MM-DD format)."""
 
-    _strip_chars = '-'
+    _strip_table = str.maketrans('', '', '_-')
     _mask_template = '9999-99-99'
     _mask_placeholder = '1970-01-01'
     _mask_compact = True
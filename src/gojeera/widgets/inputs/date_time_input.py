@@ -9,7 +9,7 @@ class DateTimeInput(BaseMaskedInputField):
     Uses MaskedInput with template '9999-99-99 99:99:99' for datetime entry.
     """
 
-    _strip_chars = '-: '
+    _strip_table = str.maketrans('', '', '_-: ')
     _mask_template = '9999-99-99 99:99:99'
     _mask_placeholder = '2025-12-23 13:45:10'
     _mask_compact = False
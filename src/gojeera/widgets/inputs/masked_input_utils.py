@@ -9,21 +9,20 @@ def allow_empty_masked_input_validation(
     widget: MaskedInput,
     value: str,
     *,
-    strip_chars: str,
+    strip_table: dict[int, int | None],
 ) -> bool:
     if not widget.valid_empty:
         return False
 
-    stripped = value
-    for char in f'_{strip_chars}':
-        stripped = stripped.replace(char, '')
-    stripped = stripped.strip()
-    if stripped:
+    if value.translate(strip_table).strip():
         return False
 
     widget.__dict__['_valid'] = True
-    widget.set_class(False, '-invalid')
-    widget.set_class(True, '-valid')
+    # Swap both classes before a single style refresh instead of refreshing once per class.
+    if widget.has_class('-invalid') or not widget.has_class('-valid'):
+        widget.remove_class('-invalid', update=False)
+        widget.add_class('-valid', update=False)
+        widget.update_node_styles()
     return True
 
 
@@ -35,11 +35,12 @@ class ExtendedTable(DataTable):
 
     def _get_row_style(self, row_index: int, base_style: Style) -> Style:
         row_style = super()._get_row_style(row_index, base_style)
-        if row_index < 0:
+        if row_index < 0 or not self._row_styles:
             return row_style
 
         row_key = self._row_locations.get_key(row_index)
-        if row_key is not None and row_key in self._row_styles:
-            return row_style + self._row_styles[row_key]
+        custom_style = self._row_styles.get(row_key) if row_key is not None else None
+        if custom_style is not None:
+            return row_style + custom_style
 
         return row_style
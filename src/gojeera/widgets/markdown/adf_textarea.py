@@ -69,6 +69,8 @@ class ADFTextAreaWidget(GojeeraMarkdown, BaseField):
                 return '_No content_'
             if isinstance(value, str):
                 return value if value.strip() else '_No content_'
+            if value.get('type') == 'doc' and not value.get('content'):
+                return '_No content_'
             markdown = convert_adf_to_markdown(value, base_url=None)
             return markdown if markdown.strip() else '_No content_'
         except Exception:
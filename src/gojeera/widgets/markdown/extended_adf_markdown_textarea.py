@@ -3,7 +3,8 @@ import logging
 from textual import on
 from textual.app import ComposeResult
 from textual.containers import Vertical, VerticalScroll
-from textual.widgets import Label, TabPane, TextArea
+from textual.timer import Timer
+from textual.widgets import Label, Tab, TabPane, TextArea
 from textual.widgets._tabbed_content import ContentTab
 
 from gojeera.utils.data.fields import (
@@ -18,6 +19,9 @@ from gojeera.widgets.navigation.extended_tabbed_content import ExtendedTabbedCon
 
 logger = logging.getLogger('gojeera')
 
+# Idle time after the last keystroke before the text is converted to check for ADF warnings.
+_ADF_WARNING_CHECK_DELAY = 0.3
+
 
 class ExtendedADFMarkdownTextArea(Vertical, BaseField):
     """
@@ -106,48 +110,82 @@ class ExtendedADFMarkdownTextArea(Vertical, BaseField):
         self._initial_wrap_width_hint = initial_wrap_width_hint
         self._suppress_initial_textarea_change = bool(initial_text)
         self._adf_warnings: list[str] = []
+        self._adf_warning_timer: Timer | None = None
+        self._last_preview_text: str | None = None
+        self._last_preview_warnings: list[str] = []
+
+        self._tabs_id = f'{field_id}-tabs'
+        self._edit_tab_id = f'{field_id}-edit-tab'
+        self._textarea_id = f'{field_id}-textarea'
+        self._preview_tab_id = f'{field_id}-preview-tab'
+        self._preview_scroll_id = f'{field_id}-preview-scroll'
+        self._markdown_id = f'{field_id}-markdown'
+        self._warnings_id = f'{field_id}-warnings'
+        self._textarea_selector = f'#{self._textarea_id}'
+        self._tabs_selector = f'#{self._tabs_id}'
+        self._markdown_selector = f'#{self._markdown_id}'
+        self._warnings_selector = f'#{self._warnings_id}'
+        self._textarea: TextArea | None = None
+        self._tabbed_content: ExtendedTabbedContent | None = None
+        self._markdown_preview: GojeeraMarkdown | None = None
+        self._warning_label: Label | None = None
+        self._preview_tab: Tab | None = None
 
     def compose(self) -> ComposeResult:
-        with ExtendedTabbedContent(id=f'{self.id}-tabs'):
-            with TabPane('Edit', id=f'{self.id}-edit-tab'):
+        with ExtendedTabbedContent(id=self._tabs_id):
+            with TabPane('Edit', id=self._edit_tab_id):
                 textarea = ExtendedTextArea(
                     self._text,
-                    id=f'{self.id}-textarea',
+                    id=self._textarea_id,
                     language='markdown',
                     compact=True,
                     initial_wrap_width_hint=self._initial_wrap_width_hint,
                 )
                 yield textarea
 
-            with TabPane('Preview', id=f'{self.id}-preview-tab'):
-                with VerticalScroll(id=f'{self.id}-preview-scroll'):
-                    yield GojeeraMarkdown('_No content to preview_', id=f'{self.id}-markdown')
+            with TabPane('Preview', id=self._preview_tab_id):
+                with VerticalScroll(id=self._preview_scroll_id):
+                    yield GojeeraMarkdown('_No content to preview_', id=self._markdown_id)
 
-        warning_label = Label('', id=f'{self.id}-warnings', classes='adf-warning')
+        warning_label = Label('', id=self._warnings_id, classes='adf-warning')
         warning_label.display = False
         yield warning_label
 
+    # Child widgets are composed once and never replaced, so the first lookup is reused.
     @property
     def textarea(self) -> TextArea:
-        return self.query_one(f'#{self.id}-textarea', TextArea)
+        if self._textarea is None:
+            self._textarea = self.query_one(self._textarea_selector, TextArea)
+        return self._textarea
 
     @property
     def tabbed_content(self) -> ExtendedTabbedContent:
-        return self.query_one(f'#{self.id}-tabs', ExtendedTabbedContent)
+        if self._tabbed_content is None:
+            self._tabbed_content = self.query_one(self._tabs_selector, ExtendedTabbedContent)
+        return self._tabbed_content
 
     @property
     def markdown_preview(self) -> GojeeraMarkdown:
-        return self.query_one(f'#{self.id}-markdown', GojeeraMarkdown)
+        if self._markdown_preview is None:
+            self._markdown_preview = self.query_one(self._markdown_selector, GojeeraMarkdown)
+        return self._markdown_preview
 
     @property
     def warning_label(self) -> Label:
-        return self.query_one(f'#{self.id}-warnings', Label)
+        if self._warning_label is None:
+            self._warning_label = self.query_one(self._warnings_selector, Label)
+        return self._warning_label
+
+    @property
+    def preview_tab(self) -> Tab:
+        if self._preview_tab is None:
+            self._preview_tab = self.tabbed_content.get_tab(self._preview_tab_id)
+        return self._preview_tab
 
     @property
     def text(self) -> str:
         try:
-            text_value = self.textarea.text if hasattr(self.textarea, 'text') else self._text
-            return text_value
+            return self.textarea.text
         except Exception:
             return self._text
 
@@ -168,8 +206,9 @@ class ExtendedADFMarkdownTextArea(Vertical, BaseField):
 
     @on(TextArea.Changed)
     def handle_textarea_changed(self, event: TextArea.Changed) -> None:
-        if event.text_area.id == f'{self.id}-textarea':
+        if event.text_area.id == self._textarea_id:
             self._text = event.text_area.text
+            self._cancel_adf_warning_check()
             if (
                 self._suppress_initial_textarea_change
                 and event.text_area.text == self._initial_text
@@ -182,27 +221,37 @@ class ExtendedADFMarkdownTextArea(Vertical, BaseField):
             self._suppress_initial_textarea_change = False
 
             if self._text.strip():
-                self._check_adf_warnings(self._text)
-            else:
-                self._adf_warnings = []
+                self._adf_warning_timer = self.set_timer(
+                    _ADF_WARNING_CHECK_DELAY, self._refresh_adf_warnings
+                )
+                return
 
+            self._adf_warnings = []
             self._update_warning_display()
-
             self._update_tab_label()
 
+    def on_unmount(self) -> None:
+        self._cancel_adf_warning_check()
+
     @on(ExtendedTabbedContent.TabActivated)
     def handle_tab_activated(self, event: ExtendedTabbedContent.TabActivated) -> None:
-        if event.pane.id == f'{self.id}-preview-tab':
+        if event.pane.id == self._preview_tab_id:
+            self._cancel_adf_warning_check()
             try:
-                current_text = self.textarea.text if hasattr(self.textarea, 'text') else ''
-                if current_text.strip():
+                current_text = self.textarea.text
+                if not current_text.strip():
+                    self.markdown_preview.update('_No content to preview_')
+                    self._adf_warnings = []
+                    self._last_preview_text = None
+                elif current_text == self._last_preview_text:
+                    self._adf_warnings = self._last_preview_warnings
+                else:
                     preview_text = render_task_checkboxes(current_text)
                     self.markdown_preview.update(preview_text)
 
                     self._check_adf_warnings(current_text)
-                else:
-                    self.markdown_preview.update('_No content to preview_')
-                    self._adf_warnings = []
+                    self._last_preview_text = current_text
+                    self._last_preview_warnings = self._adf_warnings
 
                 self._update_warning_display()
 
@@ -219,8 +268,7 @@ class ExtendedADFMarkdownTextArea(Vertical, BaseField):
 
     def make_jumpable(self) -> None:
         try:
-            content_tabs = list(self.tabbed_content.query(ContentTab))
-            for content_tab in content_tabs:
+            for content_tab in self.tabbed_content.query(ContentTab):
                 content_tab.can_focus = False
                 set_jump_mode(content_tab, 'click')
 
@@ -248,6 +296,17 @@ class ExtendedADFMarkdownTextArea(Vertical, BaseField):
         except Exception:
             pass
 
+    def _cancel_adf_warning_check(self) -> None:
+        if self._adf_warning_timer is not None:
+            self._adf_warning_timer.stop()
+            self._adf_warning_timer = None
+
+    def _refresh_adf_warnings(self) -> None:
+        self._adf_warning_timer = None
+        self._check_adf_warnings(self._text)
+        self._update_warning_display()
+        self._update_tab_label()
+
     def _check_adf_warnings(self, text: str) -> None:
         try:
             _, warnings = text_to_adf(text, track_warnings=True)
@@ -270,22 +329,6 @@ class ExtendedADFMarkdownTextArea(Vertical, BaseField):
 
     def _update_tab_label(self) -> None:
         try:
-            content_tabs = list(self.tabbed_content.query(ContentTab))
-
-            for tab in content_tabs:
-                label_str = (
-                    str(tab._label)
-                    if hasattr(tab, '_label')
-                    else str(tab.label)
-                    if hasattr(tab, 'label')
-                    else ''
-                )
-
-                if 'Preview' in label_str:
-                    if self._adf_warnings:
-                        tab.update('Preview ⚠')
-                    else:
-                        tab.update('Preview')
-                    break
+            self.preview_tab.update('Preview ⚠' if self._adf_warnings else 'Preview')
         except Exception:
             pass
@@ -1,5 +1,5 @@
 import asyncio
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 from functools import lru_cache
 from inspect import isawaitable
 import logging
@@ -50,6 +50,14 @@ ATTACHMENT_OPEN_HINT = 'Click to open attachments tab'
 ATTACHMENT_BROWSER_OPEN_HINT = 'CTRL+O to open attachment in browser'
 WORK_ITEM_TOOLTIP_FIELDS = ['summary', 'status', 'issuetype']
 
+# markdown-it keeps no state between parse() calls, so every widget shares one parser.
+_MARKDOWN_PARSER = MarkdownIt('gfm-like').use(panels_plugin).use(decision_plugin)
+
+
+def _get_markdown_parser() -> MarkdownIt:
+    """Return the shared markdown-it parser with panels and decision plugins enabled."""
+    return _MARKDOWN_PARSER
+
 
 class _AttachmentTooltipMarkdown(Protocol):
     @property
@@ -486,9 +494,22 @@ class ExtendedMarkdownParagraph(MarkdownParagraph):
     """
 
     _whitespace_pattern = re.compile(r'\s+')
-    _date_pattern = re.compile(r'\[date\](.+)')
-    _status_pattern = re.compile(r'\[status:([nrbgypt])\](.+)')
-    _decision_pattern = re.compile(r'\[decision:([dau])\](.+)')
+    # Date, status, and decision markers share one pattern; `lastgroup` names the marker.
+    _inline_marker_pattern = re.compile(
+        r'\[(?:date\](?P<date>.+)'
+        r'|status:(?P<status_color>[nrbgypt])\](?P<status>.+)'
+        r'|decision:[dau]\](?P<decision>.+))'
+    )
+    _checkbox_pattern = re.compile('[☐☑]')
+    _status_styles = {
+        'n': '.gojeera-inline-status-neutral',
+        'r': '.gojeera-inline-status-error',
+        'b': '.gojeera-inline-status-info',
+        'g': '.gojeera-inline-status-success',
+        'y': '.gojeera-inline-status-warning',
+        'p': '.gojeera-inline-status-accent',
+        't': '.gojeera-inline-status-muted',
+    }
 
     def __init__(
         self,
@@ -511,16 +532,21 @@ class ExtendedMarkdownParagraph(MarkdownParagraph):
         spans: list[Span] = []
         style_stack: list[tuple[Style | str | tuple[Style | str, ...], int]] = []
         position: int = 0
+        # Bound once because the helpers below run for every inline child token.
+        tokens_append = tokens.append
+        spans_append = spans.append
+        style_stack_append = style_stack.append
+        style_stack_pop = style_stack.pop
 
         def add_content(text: str) -> None:
             """Add text to the tokens list, and advance the position."""
             nonlocal position
-            tokens.append(text)
+            tokens_append(text)
             position += len(text)
 
         def add_style(style: Style | str | tuple[Style | str, ...]) -> None:
             """Add a style to the stack."""
-            style_stack.append((style, position))
+            style_stack_append((style, position))
 
         def get_active_attachment_filename() -> str | None:
             for style, _start in reversed(style_stack):
@@ -535,23 +561,13 @@ class ExtendedMarkdownParagraph(MarkdownParagraph):
             return None
 
         def close_tag() -> None:
-            style, start = style_stack.pop()
+            style, start = style_stack_pop()
             if isinstance(style, tuple):
                 styles = cast(tuple[Style | str, ...], style)
             else:
                 styles = (style,)
             for item in styles:
-                spans.append(Span(start, position, item))
-
-        status_class_map = {
-            'n': 'gojeera-inline-status-neutral',
-            'r': 'gojeera-inline-status-error',
-            'b': 'gojeera-inline-status-info',
-            'g': 'gojeera-inline-status-success',
-            'y': 'gojeera-inline-status-warning',
-            'p': 'gojeera-inline-status-accent',
-            't': 'gojeera-inline-status-muted',
-        }
+                spans_append(Span(start, position, item))
 
         for child in token.children:
             child_type = child.type
@@ -564,39 +580,36 @@ class ExtendedMarkdownParagraph(MarkdownParagraph):
                     add_content(self._whitespace_pattern.sub(' ', child.content))
 
             elif child_type == 'hardbreak':
-                add_content('\n')
+                tokens_append('\n')
+                position += 1
 
             elif child_type == 'softbreak':
-                add_content(' ')
+                tokens_append(' ')
+                position += 1
 
             elif child_type == 'code_inline':
                 content_text = child.content
 
-                date_match = self._date_pattern.match(content_text)
-                if date_match:
-                    date_text = date_match.group(1)
-                    add_style('.gojeera-inline-date')
-                    add_content(date_text)
-                    close_tag()
-                    continue
-
-                status_match = self._status_pattern.match(content_text)
-                if status_match:
-                    color_code = status_match.group(1)
-                    status_text = status_match.group(2)
-
-                    add_style(
-                        f'.{status_class_map.get(color_code, "gojeera-inline-status-neutral")}'
-                    )
-                    add_content(status_text)
-                    close_tag()
-                    continue
-
-                decision_match = self._decision_pattern.match(content_text)
-                if decision_match:
-                    decision_text = decision_match.group(2)
-
-                    add_content(f'⤷ {decision_text}')
+                marker_match = self._inline_marker_pattern.match(content_text)
+                if marker_match is not None:
+                    marker = marker_match.lastgroup
+                    if marker == 'date':
+                        add_style('.gojeera-inline-date')
+                        add_content(marker_match['date'])
+                        close_tag()
+                    elif marker == 'status':
+                        color_code = marker_match['status_color']
+                        status_text = marker_match['status']
+
+                        add_style(
+                            self._status_styles.get(color_code, '.gojeera-inline-status-neutral')
+                        )
+                        add_content(status_text)
+                        close_tag()
+                    else:
+                        decision_text = marker_match['decision']
+
+                        add_content(f'⤷ {decision_text}')
                     continue
 
                 add_style(build_inline_code_style())
@@ -640,21 +653,19 @@ class ExtendedMarkdownParagraph(MarkdownParagraph):
             elif child_type.endswith('_close'):
                 close_tag()
 
-        content = Content(''.join(tokens), spans=spans)
-
-        plain_text = content.plain
-        if plain_text:
-            has_unchecked = '☐' in plain_text
-            has_checked = '☑' in plain_text
-
-            if has_unchecked or has_checked:
-                for i, char in enumerate(plain_text):
-                    if has_unchecked and char == '☐':
-                        content = content.stylize('.gojeera-checkbox-unchecked', i, i + 1)
-                    elif has_checked and char == '☑':
-                        content = content.stylize('.gojeera-checkbox-checked', i, i + 1)
+        text = ''.join(tokens)
+        spans.extend(
+            Span(
+                match.start(),
+                match.end(),
+                '.gojeera-checkbox-checked'
+                if match.group() == '☑'
+                else '.gojeera-checkbox-unchecked',
+            )
+            for match in self._checkbox_pattern.finditer(text)
+        )
 
-        return trim_interactive_span_whitespace(content)
+        return trim_interactive_span_whitespace(Content(text, spans=spans))
 
     def set_content(self, content: Content) -> None:
         super().set_content(content)
@@ -768,6 +779,19 @@ class ExtendedMarkdownParagraph(MarkdownParagraph):
             self.tooltip = tooltip
 
 
+def _iter_code_inline_contents(tokens: list[Token]) -> Iterator[str]:
+    """Yield the content of every inline code span nested anywhere under the tokens."""
+    for token in tokens:
+        children = token.children
+        if not children:
+            continue
+        if token.type == 'inline':
+            for child in children:
+                if child.type == 'code_inline':
+                    yield child.content
+        yield from _iter_code_inline_contents(children)
+
+
 class GojeeraBlockQuote(MarkdownBlockQuote):
     """Blockquote with support for GitHub-style alerts."""
 
@@ -850,25 +874,13 @@ class GojeeraBlockQuote(MarkdownBlockQuote):
 
     _decision_detection_pattern = re.compile(r'\[decision:[dau]\]')
 
-    def _detect_decision_blockquote(self, tokens: list) -> bool:
+    def _detect_decision_blockquote(self, tokens: list[Token]) -> bool:
         """Detect if blockquote contains decision items and apply styling."""
 
-        stack = list(tokens)
-
-        while stack:
-            token = stack.pop()
-
-            if hasattr(token, 'type') and token.type == 'inline':
-                if hasattr(token, 'children') and token.children:
-                    for child in token.children:
-                        if hasattr(child, 'type') and child.type == 'code_inline':
-                            content = getattr(child, 'content', '')
-                            if self._decision_detection_pattern.match(content):
-                                self.add_class('decision')
-                                return True
-
-            if hasattr(token, 'children') and token.children:
-                stack.extend(token.children)
+        pattern = self._decision_detection_pattern
+        if any(pattern.match(content) for content in _iter_code_inline_contents(tokens)):
+            self.add_class('decision')
+            return True
 
         return False
 
@@ -1064,18 +1076,6 @@ class GojeeraMarkdown(Markdown):
         'code_block': GojeeraMarkdownFence,
     }
 
-    _cached_parser: MarkdownIt | None = None
-
-    @classmethod
-    def _create_parser(cls) -> MarkdownIt:
-        """Create a markdown-it parser with panels and decision plugins enabled."""
-        if cls._cached_parser is None:
-            parser = MarkdownIt('gfm-like')
-            parser.use(panels_plugin)
-            parser.use(decision_plugin)
-            cls._cached_parser = parser
-        return cls._cached_parser
-
     def __init__(
         self,
         markdown: str | None = None,
@@ -1094,7 +1094,7 @@ class GojeeraMarkdown(Markdown):
 
         super().__init__(
             markdown=markdown,
-            parser_factory=parser_factory or self._create_parser,
+            parser_factory=parser_factory or _get_markdown_parser,
             name=name,
             id=id,
             classes=classes,
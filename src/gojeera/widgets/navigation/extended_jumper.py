@@ -1,5 +1,6 @@
 from typing import Literal, Protocol, cast
 
+from textual.dom import DOMNode
 from textual.errors import NoWidget
 from textual.geometry import Offset
 from textual.widget import Widget
@@ -50,9 +51,8 @@ class ExtendedJumper(Jumper):
     def get_overlays(self):
         """Build jump targets in a single filtered pass."""
         screen = self.screen
-        content_tabs = [
-            widget for widget in screen.walk_children() if isinstance(widget, ContentTab)
-        ]
+        candidate_widgets: list[Widget] = list(screen.walk_children(Widget))
+        content_tabs = [widget for widget in candidate_widgets if isinstance(widget, ContentTab)]
 
         original_states = {}
         for tab in content_tabs:
@@ -63,20 +63,13 @@ class ExtendedJumper(Jumper):
             ids_to_keys = self.ids_to_keys
             jumpable_widgets: list[tuple[Offset, Widget, JumpMode]] = []
             custom_key_count = 0
-            seen_widgets: set[Widget] = set()
-
-            candidate_widgets: list[Widget] = list(screen.walk_children(Widget))
-            candidate_widgets.extend(content_tabs)
+            ancestor_visibility: dict[DOMNode, bool] = {}
 
             for child in candidate_widgets:
-                if child in seen_widgets:
-                    continue
-                seen_widgets.add(child)
-
                 jump_mode = getattr(child, 'jump_mode', None)
                 if jump_mode not in ('focus', 'click') or not child.can_focus:
                     continue
-                if not self._is_widget_jumpable(child):
+                if not self._is_widget_jumpable(child, ancestor_visibility):
                     continue
 
                 try:
@@ -115,7 +108,7 @@ class ExtendedJumper(Jumper):
             for tab, original_state in original_states.items():
                 tab.can_focus = original_state
 
-    def _is_widget_jumpable(self, widget: Widget) -> bool:
+    def _is_widget_jumpable(self, widget: Widget, ancestor_visibility: dict[DOMNode, bool]) -> bool:
         if not widget.display or not widget.visible or not widget.is_on_screen:
             return False
 
@@ -125,16 +118,28 @@ class ExtendedJumper(Jumper):
         if isinstance(widget, ListView) and len(widget) == 0:
             return False
 
+        # Sibling targets share most of their ancestors, so every widget whose
+        # chain has been resolved is recorded for the rest of the pass.
+        unresolved: list[DOMNode] = []
+        chain_visible = True
         current = widget
         while current is not None:
-            if hasattr(current, 'display') and not current.display:
-                return False
-            if hasattr(current, 'visible') and not current.visible:
-                return False
-            if getattr(current, 'disabled', False):
-                return False
-            if getattr(current, 'read_only', False):
-                return False
+            cached_visibility = ancestor_visibility.get(current)
+            if cached_visibility is not None:
+                chain_visible = cached_visibility
+                break
+            unresolved.append(current)
+            if (
+                (hasattr(current, 'display') and not current.display)
+                or (hasattr(current, 'visible') and not current.visible)
+                or getattr(current, 'disabled', False)
+                or getattr(current, 'read_only', False)
+            ):
+                chain_visible = False
+                break
             current = current.parent
 
-        return True
+        for resolved in unresolved:
+            ancestor_visibility[resolved] = chain_visible
+
+        return chain_visible
@@ -1,7 +1,7 @@
 from itertools import zip_longest
 import logging
 from types import MethodType
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from textual.app import ComposeResult
 from textual.binding import Binding
@@ -17,6 +17,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger('gojeera')
 
+# Tab-scoped actions that are only available while their tab is active.
+_ACTION_TABS = {
+    'edit_work_item_info': 'tab-description',
+    'add_attachment': 'tab-attachments',
+    'create_work_item_subtask': 'tab-subtasks',
+    'link_work_item': 'tab-related',
+    'add_remote_link': 'tab-links',
+}
+
 
 def _highlight_active_full_width(self: ContentTabs, animate: bool = True) -> None:
     """Move the underline bar to span the full active tab region, including padding."""
@@ -245,16 +254,9 @@ class ExtendedTabbedContent(TabbedContent):
 
     def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:
         del parameters
-        if action == 'edit_work_item_info':
-            return self.active == 'tab-description'
-        if action == 'add_attachment':
-            return self.active == 'tab-attachments'
-        if action == 'create_work_item_subtask':
-            return self.active == 'tab-subtasks'
-        if action == 'link_work_item':
-            return self.active == 'tab-related'
-        if action == 'add_remote_link':
-            return self.active == 'tab-links'
+        required_tab = _ACTION_TABS.get(action)
+        if required_tab is not None:
+            return self.active == required_tab
         if action == 'add_comment':
             if self.active != 'tab-comments':
                 return False
@@ -283,22 +285,17 @@ class ExtendedTabbedContent(TabbedContent):
 
     async def action_create_work_item_subtask(self) -> None:
         if self.active == 'tab-subtasks':
-            from typing import cast
-
             from gojeera.components.screens.create_work_item_screen import AddWorkItemScreen
 
-            screen = cast('JiraApp', self.app)
+            app = cast('JiraApp', self.app)
 
             project_key = None
             if (
-                screen.work_item_info_container.work_item
-                and screen.work_item_info_container.work_item.project
+                app.work_item_info_container.work_item
+                and app.work_item_info_container.work_item.project
             ):
-                project_key = screen.work_item_info_container.work_item.project.key
-
-            from gojeera.app import JiraApp
+                project_key = app.work_item_info_container.work_item.project.key
 
-            app = cast(JiraApp, self.app)
             reporter_account_id = (
                 app.atlassian_context.user_info.account_id
                 if app.atlassian_context.user_info
@@ -309,9 +306,9 @@ class ExtendedTabbedContent(TabbedContent):
                 AddWorkItemScreen(
                     project_key=project_key,
                     reporter_account_id=reporter_account_id,
-                    parent_work_item=screen.work_item_info_container.work_item,
+                    parent_work_item=app.work_item_info_container.work_item,
                 ),
-                callback=screen.create_work_item,
+                callback=app.create_work_item,
             )
 
     async def action_link_work_item(self) -> None:
@@ -376,7 +373,8 @@ class ExtendedTabbedContent(TabbedContent):
 
         if focused:
             active_pane = self._active_focus_pane()
-            if active_pane and focused in active_pane.walk_children():
+            # Checking the focused widget's ancestors avoids walking the whole pane subtree.
+            if active_pane and active_pane in focused.ancestors:
                 first_focusable = None
                 for child in active_pane.walk_children():
                     can_focus = getattr(child, 'can_focus', False)
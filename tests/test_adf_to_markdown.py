@@ -1,4 +1,7 @@
-from gojeera.utils.markdown.adf_helpers import convert_adf_to_markdown
+from gojeera.utils.markdown.adf_helpers import (
+    convert_adf_to_markdown,
+    convert_many_adfs_to_markdown,
+)
 
 
 def build_adf_doc(*content):
@@ -344,3 +347,26 @@ class TestAdfToMarkdownConversion:
         assert 'WARN main' in markdown
         assert 'status moves to `Waiting For Tag`.' in markdown
         assert '`` Waiting For Tag ``' not in markdown
+
+    def test_convert_many_adfs_preserves_order_and_matches_single_conversion(self):
+        first = build_adf_doc(build_paragraph(build_text_node('first')))
+        second = build_adf_doc(build_paragraph(build_text_node('second')))
+
+        markdowns = convert_many_adfs_to_markdown([first, second, first])
+
+        assert markdowns == [
+            convert_adf_to_markdown(first),
+            convert_adf_to_markdown(second),
+            convert_adf_to_markdown(first),
+        ]
+
+    def test_convert_many_adfs_uses_thread_pool_without_gil(self, monkeypatch):
+        import sys
+
+        first = build_adf_doc(build_paragraph(build_text_node('first')))
+        second = build_adf_doc(build_paragraph(build_text_node('second')))
+        monkeypatch.setattr(sys, '_is_gil_enabled', lambda: False, raising=False)
+
+        markdowns = convert_many_adfs_to_markdown([first, second], workers=2)
+
+        assert markdowns == [convert_adf_to_markdown(first), convert_adf_to_markdown(second)]
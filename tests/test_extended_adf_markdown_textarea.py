@@ -0,0 +1,162 @@
+import asyncio
+
+from gojeera.app import JiraApp
+from gojeera.components.screens.comment_screen import CommentScreen
+from gojeera.widgets.markdown import extended_adf_markdown_textarea
+from gojeera.widgets.markdown.extended_adf_markdown_textarea import (
+    _ADF_WARNING_CHECK_DELAY,
+    ExtendedADFMarkdownTextArea,
+)
+
+from .test_helpers import wait_until
+
+WARNING_TEXT = 'see [broken] link'
+
+
+def count_adf_warning_checks(monkeypatch) -> list[str]:
+    checked_texts: list[str] = []
+    original_text_to_adf = extended_adf_markdown_textarea.text_to_adf
+
+    def counting_text_to_adf(text, track_warnings=False):
+        checked_texts.append(text)
+        return original_text_to_adf(text, track_warnings=track_warnings)
+
+    monkeypatch.setattr(extended_adf_markdown_textarea, 'text_to_adf', counting_text_to_adf)
+    return checked_texts
+
+
+async def open_comment_field(pilot) -> ExtendedADFMarkdownTextArea:
+    await pilot.app.workers.wait_for_complete()
+    await pilot.app.push_screen(CommentScreen(mode='new', work_item_key='ENG-3'))
+    await wait_until(lambda: isinstance(pilot.app.screen, CommentScreen), timeout=2.0)
+    field = pilot.app.screen.query_one(ExtendedADFMarkdownTextArea)
+    field.textarea.focus()
+    await wait_until(lambda: field.textarea.has_focus, timeout=1.0)
+    await pilot.app.workers.wait_for_complete()
+    await pilot.pause()
+    return field
+
+
+async def wait_past_warning_check_delay(pilot) -> None:
+    await asyncio.sleep(_ADF_WARNING_CHECK_DELAY + 0.2)
+    await pilot.pause()
+
+
+def preview_tab_label(field: ExtendedADFMarkdownTextArea) -> str:
+    return str(field.preview_tab.render())
+
+
+class TestExtendedADFMarkdownTextAreaWarnings:
+    async def test_rapid_edits_are_checked_once_after_delay(
+        self, monkeypatch, mock_configuration, mock_user_info
+    ):
+        checked_texts = count_adf_warning_checks(monkeypatch)
+        app = JiraApp(settings=mock_configuration, user_info=mock_user_info)
+
+        async with app.run_test(size=(120, 40)) as pilot:
+            field = await open_comment_field(pilot)
+
+            for character in WARNING_TEXT:
+                field.textarea.insert(character)
+                await pilot.pause()
+
+            assert checked_texts == []
+            assert not field.warning_label.display
+            assert preview_tab_label(field) == 'Preview'
+
+            await wait_past_warning_check_delay(pilot)
+
+            assert checked_texts == [WARNING_TEXT]
+            assert field.warning_label.display
+            assert 'Incomplete link syntax' in str(field.warning_label.render())
+            assert preview_tab_label(field) == 'Preview ⚠'
+
+    async def test_clearing_text_cancels_pending_check(
+        self, monkeypatch, mock_configuration, mock_user_info
+    ):
+        checked_texts = count_adf_warning_checks(monkeypatch)
+        app = JiraApp(settings=mock_configuration, user_info=mock_user_info)
+
+        async with app.run_test(size=(120, 40)) as pilot:
+            field = await open_comment_field(pilot)
+
+            field.textarea.insert(WARNING_TEXT)
+            await pilot.pause()
+            field.textarea.clear()
+            await pilot.pause()
+
+            await wait_past_warning_check_delay(pilot)
+
+            assert checked_texts == []
+            assert not field.warning_label.display
+            assert preview_tab_label(field) == 'Preview'
+
+    async def test_unmount_cancels_pending_check(
+        self, monkeypatch, mock_configuration, mock_user_info
+    ):
+        checked_texts = count_adf_warning_checks(monkeypatch)
+        app = JiraApp(settings=mock_configuration, user_info=mock_user_info)
+
+        async with app.run_test(size=(120, 40)) as pilot:
+            field = await open_comment_field(pilot)
+
+            field.textarea.insert(WARNING_TEXT)
+            await pilot.pause()
+            assert field._adf_warning_timer is not None
+
+            await field.remove()
+
+            assert field._adf_warning_timer is None
+            await wait_past_warning_check_delay(pilot)
+            assert checked_texts == []
+
+
+class TestExtendedADFMarkdownTextAreaPreview:
+    async def test_preview_warnings_refresh_after_edits(
+        self, monkeypatch, mock_configuration, mock_user_info
+    ):
+        checked_texts = count_adf_warning_checks(monkeypatch)
+        app = JiraApp(settings=mock_configuration, user_info=mock_user_info)
+
+        async def show_tab(field: ExtendedADFMarkdownTextArea, tab_id: str) -> None:
+            field.tabbed_content.active = tab_id
+            await wait_until(lambda: field.tabbed_content.active == tab_id, timeout=1.0)
+            await pilot.pause()
+
+        async with app.run_test(size=(120, 40)) as pilot:
+            field = await open_comment_field(pilot)
+            edit_tab_id = field._edit_tab_id
+            preview_tab_id = field._preview_tab_id
+
+            field.textarea.insert('plain text')
+            await show_tab(field, preview_tab_id)
+
+            assert field.markdown_preview.source == 'plain text'
+            assert not field.warning_label.display
+            assert preview_tab_label(field) == 'Preview'
+
+            await show_tab(field, edit_tab_id)
+            field.textarea.insert(f' and {WARNING_TEXT}')
+            await show_tab(field, preview_tab_id)
+
+            assert field.markdown_preview.source == f'plain text and {WARNING_TEXT}'
+            assert field.warning_label.display
+            assert 'Incomplete link syntax' in str(field.warning_label.render())
+            assert preview_tab_label(field) == 'Preview ⚠'
+
+            await show_tab(field, edit_tab_id)
+            await show_tab(field, preview_tab_id)
+
+            assert checked_texts == ['plain text', f'plain text and {WARNING_TEXT}']
+            assert field.warning_label.display
+            assert preview_tab_label(field) == 'Preview ⚠'
+
+            await show_tab(field, edit_tab_id)
+            field.textarea.clear()
+            field.textarea.insert('fixed text')
+            await show_tab(field, preview_tab_id)
+
+            assert field.markdown_preview.source == 'fixed text'
+            assert not field.warning_label.display
+            assert preview_tab_label(field) == 'Preview'
+            assert checked_texts[-1] == 'fixed text'
@@ -1,5 +1,41 @@
+from markdown_it import MarkdownIt
+import pytest
+
 from gojeera.utils.data.mappings import get_nested
-from gojeera.utils.markdown.adf_helpers import text_to_adf
+from gojeera.utils.markdown.adf_helpers import (
+    _MARKDOWN_TO_ADF_PARSER,
+    _PLAIN_TEXT_PATTERN,
+    _convert_tokens_to_adf,
+    text_to_adf,
+)
+from gojeera.utils.markdown.mdit_adf_decision import decision_plugin
+
+
+def parse_text_to_adf_without_fast_path(text: str) -> dict:
+    content, _ = _convert_tokens_to_adf(_MARKDOWN_TO_ADF_PARSER.parse(text))
+    return {'type': 'doc', 'version': 1, 'content': content}
+
+
+def build_paragraph(text: str) -> dict:
+    return {'type': 'paragraph', 'content': [{'type': 'text', 'text': text}]}
+
+
+def build_list_item(*content: dict) -> dict:
+    return {'type': 'listItem', 'content': list(content)}
+
+
+def build_list(list_type: str, *items: dict) -> dict:
+    return {'type': list_type, 'content': list(items)}
+
+
+def parse_decision_tokens(markdown: str) -> list[tuple]:
+    tokens = MarkdownIt('gfm-like').use(decision_plugin).parse(markdown)
+    return [
+        (token.type, token.attrGet('class'), token.content)
+        if token.type == 'inline' or token.attrGet('class')
+        else (token.type,)
+        for token in tokens
+    ]
 
 
 class TestMarkdownToAdfConversion:
@@ -140,3 +176,351 @@ class TestMarkdownToAdfConversion:
         assert len(date_nodes) == 2
         assert date_nodes[0]['attrs']['timestamp'] == '1776988800000'
         assert date_nodes[1]['attrs']['timestamp'] == '1777075200000'
+
+    def test_repeated_conversion_returns_independent_documents(self):
+        markdown = 'Some **bold** text'
+
+        first = text_to_adf(markdown)
+        first['content'][0]['content'].clear()
+
+        second = text_to_adf(markdown)
+
+        assert [node['text'] for node in second['content'][0]['content']] == [
+            'Some ',
+            'bold',
+            ' text',
+        ]
+
+    @pytest.mark.parametrize(
+        'text',
+        [
+            'Hello world',
+            'Is it done?',
+            'Done. Next step',
+            'end.',
+            'Wait, what? (Really) "yes"; it\'s fine.',
+            "O'Reilly",
+            'C3PO and R2D2',
+            'Cafe déjà vu',
+            'Ünïcödé naïve façade',
+            'Привет мир',
+            '日本語のテキスト',
+        ],
+    )
+    def test_plain_text_fast_path_matches_full_parser(self, text):
+        assert _PLAIN_TEXT_PATTERN.fullmatch(text)
+        assert text_to_adf(text) == parse_text_to_adf_without_fast_path(text)
+
+    @pytest.mark.parametrize(
+        'text',
+        [
+            'example.com',
+            'Visit example.com today',
+            'www.example.com',
+            'hello@example.com',
+            'https://example.com',
+            'Trailing space ',
+            'Trailing spaces  ',
+            '1. item',
+            '1st place',
+            '- item',
+            '# heading',
+            '**bold**',
+            'snake_case',
+            'Hello!',
+            'foo...',
+            '(see above)',
+            'x < y',
+            'Tom & Jerry',
+            'Hello\tworld',
+        ],
+    )
+    def test_plain_text_fast_path_rejects_parser_relevant_text(self, text):
+        assert _PLAIN_TEXT_PATTERN.fullmatch(text) is None
+        assert text_to_adf(text) == parse_text_to_adf_without_fast_path(text)
+
+
+class TestMarkdownListConversion:
+    def test_deeply_nested_bullet_list(self):
+        # Nine levels is as deep as markdown-it parses lists with its default maxNesting.
+        depth = 9
+        markdown = ''.join(f'{"  " * level}- item {level}\n' for level in range(depth))
+
+        adf = text_to_adf(markdown)
+
+        node = adf['content'][0]
+        for level in range(depth):
+            assert node['type'] == 'bulletList'
+            assert len(node['content']) == 1
+            item_content = node['content'][0]['content']
+            assert item_content[0] == build_paragraph(f'item {level}')
+            if level < depth - 1:
+                assert len(item_content) == 2
+                node = item_content[1]
+            else:
+                assert len(item_content) == 1
+
+    def test_ordered_list_inside_bullet_list(self):
+        markdown = '- a\n  1. one\n  2. two\n- b\n'
+
+        assert text_to_adf(markdown)['content'] == [
+            build_list(
+                'bulletList',
+                build_list_item(
+                    build_paragraph('a'),
+                    build_list(
+                        'orderedList',
+                        build_list_item(build_paragraph('one')),
+                        build_list_item(build_paragraph('two')),
+                    ),
+                ),
+                build_list_item(build_paragraph('b')),
+            )
+        ]
+
+    def test_bullet_and_ordered_lists_alternate_inside_ordered_list(self):
+        markdown = '3. a\n   - b\n     1. c\n4. d\n'
+
+        assert text_to_adf(markdown)['content'] == [
+            build_list(
+                'orderedList',
+                build_list_item(
+                    build_paragraph('a'),
+                    build_list(
+                        'bulletList',
+                        build_list_item(
+                            build_paragraph('b'),
+                            build_list('orderedList', build_list_item(build_paragraph('c'))),
+                        ),
+                    ),
+                ),
+                build_list_item(build_paragraph('d')),
+            )
+        ]
+
+    def test_list_item_with_paragraphs_code_block_and_nested_list(self):
+        # List items keep paragraphs and nested lists; other blocks such as fenced
+        # code are skipped without disturbing the surrounding items.
+        markdown = (
+            '- first\n\n  second\n\n  ```py\n  x = 1\n  ```\n\n  - nested\n\n  third\n- next\n'
+        )
+
+        assert text_to_adf(markdown)['content'] == [
+            build_list(
+                'bulletList',
+                build_list_item(
+                    build_paragraph('first'),
+                    build_paragraph('second'),
+                    build_list('bulletList', build_list_item(build_paragraph('nested'))),
+                    build_paragraph('third'),
+                ),
+                build_list_item(build_paragraph('next')),
+            )
+        ]
+
+    def test_task_items_nested_in_bullet_list(self):
+        markdown = '- a\n  - [ ] sub\n  - [x] done\n- b\n'
+
+        assert text_to_adf(markdown)['content'] == [
+            build_list(
+                'bulletList',
+                build_list_item(
+                    build_paragraph('a'),
+                    build_list(
+                        'bulletList',
+                        build_list_item(build_paragraph(' sub')),
+                        build_list_item(build_paragraph(' done')),
+                    ),
+                ),
+                build_list_item(build_paragraph('b')),
+            )
+        ]
+
+    def test_list_items_closing_several_levels_at_once(self):
+        markdown = '- a\n  - b\n    - c\n- d\n\nafter\n'
+
+        assert text_to_adf(markdown)['content'] == [
+            build_list(
+                'bulletList',
+                build_list_item(
+                    build_paragraph('a'),
+                    build_list(
+                        'bulletList',
+                        build_list_item(
+                            build_paragraph('b'),
+                            build_list('bulletList', build_list_item(build_paragraph('c'))),
+                        ),
+                    ),
+                ),
+                build_list_item(build_paragraph('d')),
+            ),
+            build_paragraph('after'),
+        ]
+
+    def test_nested_lists_close_when_document_ends(self):
+        markdown = '1. a\n   - b\n     - c'
+
+        assert text_to_adf(markdown)['content'] == [
+            build_list(
+                'orderedList',
+                build_list_item(
+                    build_paragraph('a'),
+                    build_list(
+                        'bulletList',
+                        build_list_item(
+                            build_paragraph('b'),
+                            build_list('bulletList', build_list_item(build_paragraph('c'))),
+                        ),
+                    ),
+                ),
+            )
+        ]
+
+
+class TestDecisionPlugin:
+    def test_multiple_decision_blockquotes_in_one_document(self):
+        markdown = '> `[decision:d]` Ship it\n\nBetween\n\n> `[decision:u]` Revisit later\n'
+
+        assert parse_decision_tokens(markdown) == [
+            ('blockquote_open', 'decision', ''),
+            ('paragraph_open',),
+            ('inline', None, 'DECISION DECIDED'),
+            ('paragraph_close',),
+            ('paragraph_open',),
+            ('inline', None, ' Ship it'),
+            ('paragraph_close',),
+            ('blockquote_close',),
+            ('paragraph_open',),
+            ('inline', None, 'Between'),
+            ('paragraph_close',),
+            ('blockquote_open', 'decision', ''),
+            ('paragraph_open',),
+            ('inline', None, 'DECISION UP FOR DISCUSSION'),
+            ('paragraph_close',),
+            ('paragraph_open',),
+            ('inline', None, ' Revisit later'),
+            ('paragraph_close',),
+            ('blockquote_close',),
+        ]
+
+    def test_decision_nested_inside_blockquote(self):
+        markdown = '> Context\n>\n> > `[decision:a]` Noted\n'
+
+        assert parse_decision_tokens(markdown) == [
+            ('blockquote_open', 'decision', ''),
+            ('paragraph_open',),
+            ('inline', None, 'Context'),
+            ('paragraph_close',),
+            ('blockquote_open',),
+            ('paragraph_open',),
+            ('inline', None, 'DECISION ACKNOWLEDGED'),
+            ('paragraph_close',),
+            ('paragraph_open',),
+            ('inline', None, ' Noted'),
+            ('paragraph_close',),
+            ('blockquote_close',),
+            ('blockquote_close',),
+        ]
+
+    def test_heading_decision_split_reaching_nested_blockquote(self):
+        # The heading split spans into the nested blockquote without changing the
+        # token count; the nested decisions must still be processed afterwards.
+        markdown = (
+            '> Intro\n'
+            '> # `[decision:d]` Heading\n'
+            '> Body\n'
+            '> > `[decision:d]` First\n'
+            '> > `[decision:a]` Second\n'
+        )
+
+        assert parse_decision_tokens(markdown) == [
+            ('blockquote_open', 'decision', ''),
+            ('paragraph_open',),
+            ('inline', None, 'DECISION DECIDED'),
+            ('paragraph_close',),
+            ('paragraph_open',),
+            ('inline', None, ' Heading'),
+            ('paragraph_close',),
+            ('blockquote_open', 'decision', ''),
+            ('paragraph_open',),
+            ('inline', None, 'DECISION DECIDED'),
+            ('paragraph_close',),
+            ('paragraph_open',),
+            ('inline', None, 'DECISION ACKNOWLEDGED'),
+            ('paragraph_close',),
+            ('paragraph_open',),
+            ('inline', None, ' First Second'),
+            ('paragraph_close',),
+            ('blockquote_close',),
+            ('blockquote_close',),
+        ]
+
+    def test_blockquote_with_several_decision_paragraphs(self):
+        markdown = (
+            '> `[decision:d]` First\n'
+            '>\n'
+            '> Context\n'
+            '>\n'
+            '> `[decision:a]` Second\n'
+            '>\n'
+            '> `[decision:u]` Third\n'
+        )
+
+        assert parse_decision_tokens(markdown) == [
+            ('blockquote_open', 'decision', ''),
+            ('paragraph_open',),
+            ('inline', None, 'DECISION DECIDED'),
+            ('paragraph_close',),
+            ('paragraph_open',),
+            ('inline', None, ' First'),
+            ('paragraph_close',),
+            ('paragraph_open',),
+            ('inline', None, 'Context'),
+            ('paragraph_close',),
+            ('paragraph_open',),
+            ('inline', None, 'DECISION ACKNOWLEDGED'),
+            ('paragraph_close',),
+            ('paragraph_open',),
+            ('inline', None, ' Second'),
+            ('paragraph_close',),
+            ('paragraph_open',),
+            ('inline', None, 'DECISION UP FOR DISCUSSION'),
+            ('paragraph_close',),
+            ('paragraph_open',),
+            ('inline', None, ' Third'),
+            ('paragraph_close',),
+            ('blockquote_close',),
+        ]
+
+    def test_only_first_decision_in_a_paragraph_is_split(self):
+        markdown = '> `[decision:d]` First\n> `[decision:a]` Second\n'
+
+        assert parse_decision_tokens(markdown) == [
+            ('blockquote_open', 'decision', ''),
+            ('paragraph_open',),
+            ('inline', None, 'DECISION DECIDED'),
+            ('paragraph_close',),
+            ('paragraph_open',),
+            ('inline', None, ' First Second'),
+            ('paragraph_close',),
+            ('blockquote_close',),
+        ]
+
+    def test_heading_decision_split_overlapping_previous_split(self):
+        # The heading has no paragraph of its own, so its bounds reach back into the
+        # paragraph produced by the previous split.
+        markdown = '> `[decision:a]` Noted\n> # `[decision:d]` Heading\n> Body\n'
+
+        assert parse_decision_tokens(markdown) == [
+            ('blockquote_open', 'decision', ''),
+            ('paragraph_open',),
+            ('inline', None, 'DECISION ACKNOWLEDGED'),
+            ('paragraph_close',),
+            ('paragraph_open',),
+            ('inline', None, 'DECISION DECIDED'),
+            ('paragraph_close',),
+            ('paragraph_open',),
+            ('inline', None, ' Heading'),
+            ('paragraph_close',),
+            ('blockquote_close',),
+        ]